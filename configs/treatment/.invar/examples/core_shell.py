@@ -5,6 +5,7 @@ Reference patterns for Core vs Shell architecture.
 Managed by Invar - do not edit directly.
 """
 
+from collections import Counter
 from pathlib import Path
 
 # For lambda-based contracts, use deal directly
@@ -51,10 +52,8 @@ def count_items(items: list[str]) -> dict[str, int]:
     >>> count_items([])
     {}
     """
-    counts: dict[str, int] = {}
-    for item in items:
-        counts[item] = counts.get(item, 0) + 1
-    return counts
+    # Counter runs the counting loop in C (_count_elements fast path)
+    return dict(Counter(items))
 
 
 # =============================================================================
@@ -85,17 +84,15 @@ def count_lines_in_file(path: Path) -> Result[dict[str, int], str]:
 
     Shell reads file → Core parses content → Shell returns result.
     """
-    # Shell: I/O operation
-    content_result = read_file(path)
-
-    if isinstance(content_result, Failure):
-        return content_result
-
-    content = content_result.unwrap()
-
-    # Core: Pure logic (no I/O)
-    lines = parse_lines(content)
-    counts = count_items(lines)
+    # Shell: I/O operation — match on the Result instead of
+    # isinstance + unwrap (single type-tag check, no round-trip)
+    match read_file(path):
+        case Failure() as failure:
+            return failure
+        case Success(content):
+            # Core: Pure logic (no I/O)
+            lines = parse_lines(content)
+            counts = count_items(lines)
 
     # Shell: Return result
     return Success(counts)
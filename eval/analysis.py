@@ -3,11 +3,84 @@ Statistical analysis for benchmark results.
 """
 
 import math
-from dataclasses import dataclass
+import statistics
+import sys
+from dataclasses import asdict, dataclass
 from typing import Any
 
-
-@dataclass
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional accelerator; the pure-Python kernel is fine
+    njit = None
+
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+# Interned so status comparisons hit the pointer-equality fast path
+_STATUS_COMPLETED = sys.intern("completed")
+
+_METRICS_TO_ANALYZE: tuple[tuple[str, str], ...] = (
+    ("tests_passed", "Tests Passed"),
+    ("hidden_tests_passed", "Hidden Tests Passed"),
+    ("iterations", "Iterations"),
+    ("total_tokens", "Total Tokens"),
+    ("lines_of_code", "Lines of Code"),
+    ("cyclomatic_complexity", "Cyclomatic Complexity"),
+)
+
+
+def build_metric_columns(
+    results: list[dict[str, Any]],
+    keys: tuple[str, ...] = tuple(k for k, _ in _METRICS_TO_ANALYZE),
+) -> dict[str, np.ndarray]:
+    """
+    Extract metric columns from completed results in a single pass.
+
+    Converts the record-oriented list[dict] layout into one contiguous
+    float64 array per metric key, so repeated analyses reduce over
+    cache-friendly arrays instead of chasing dict lookups per record.
+    """
+    columns: dict[str, list[float]] = {key: [] for key in keys}
+    appends = [(key, columns[key].append) for key in keys]
+    for r in results:
+        if r.get("status") != _STATUS_COMPLETED:
+            continue
+        m = r.get("metrics") or {}
+        for key, append in appends:
+            append(m.get(key, 0.0))
+    return {key: np.asarray(vals, dtype=np.float64) for key, vals in columns.items()}
+
+
+def _normal_cdf(x: float) -> float:
+    """Approximate standard normal CDF."""
+    # Approximation using error function
+    return 0.5 * (1 + math.erf(x * _INV_SQRT2))
+
+
+def _welch_kernel(arr1, arr2):
+    """
+    Reduction core of Welch's t-test: per-group mean and sample variance.
+
+    Returns (mean1, mean2, var1, var2).  Written with explicit
+    reductions so Numba can compile it to a single native loop; the
+    plain-Python fallback runs the same code on NumPy arrays.  The
+    scalar t/p arithmetic lives in welch_t_test_from_stats.
+    """
+    n1 = arr1.shape[0]
+    n2 = arr2.shape[0]
+    mean1 = arr1.sum() / n1
+    mean2 = arr2.sum() / n2
+    var1 = ((arr1 - mean1) ** 2).sum() / (n1 - 1)
+    var2 = ((arr2 - mean2) ** 2).sum() / (n2 - 1)
+    return mean1, mean2, var1, var2
+
+
+if njit is not None:
+    _welch_kernel = njit(cache=True, fastmath=True)(_welch_kernel)
+
+
+@dataclass(slots=True, frozen=True)
 class TTestResult:
     """Result of a t-test."""
     metric_name: str
@@ -23,38 +96,29 @@ class TTestResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "metric_name": self.metric_name,
-            "control_mean": self.control_mean,
-            "treatment_mean": self.treatment_mean,
-            "control_std": self.control_std,
-            "treatment_std": self.treatment_std,
-            "t_statistic": self.t_statistic,
-            "p_value": self.p_value,
-            "effect_size": self.effect_size,
-            "significant": self.significant,
-            "warning": self.warning,
-        }
+        return asdict(self)
 
 
 class StatisticalAnalysis:
     """Statistical analysis utilities for benchmark results."""
 
     @staticmethod
-    def mean(values: list[float]) -> float:
+    def mean(values: "list[float] | np.ndarray") -> float:
         """Calculate mean."""
-        if not values:
-            return 0.0
-        return sum(values) / len(values)
+        if isinstance(values, np.ndarray):
+            return float(values.mean()) if values.size else 0.0
+        # statistics.fmean is a C-level float loop: more accurate than
+        # sum/len and cheaper than an ndarray round-trip for small lists.
+        return statistics.fmean(values) if values else 0.0
 
     @staticmethod
-    def std(values: list[float]) -> float:
-        """Calculate standard deviation."""
+    def std(values: "list[float] | np.ndarray") -> float:
+        """Calculate standard deviation (sample, ddof=1)."""
+        if isinstance(values, np.ndarray):
+            return float(values.std(ddof=1)) if values.size >= 2 else 0.0
         if len(values) < 2:
             return 0.0
-        m = StatisticalAnalysis.mean(values)
-        variance = sum((x - m) ** 2 for x in values) / (len(values) - 1)
-        return math.sqrt(variance)
+        return math.sqrt(statistics.variance(values))
 
     @staticmethod
     def cohens_d(
@@ -85,8 +149,8 @@ class StatisticalAnalysis:
 
     @staticmethod
     def welch_t_test(
-        values1: list[float],
-        values2: list[float],
+        values1: "list[float] | np.ndarray",
+        values2: "list[float] | np.ndarray",
     ) -> tuple[float, float, str | None]:
         """
         Perform Welch's t-test (unequal variances).
@@ -94,16 +158,36 @@ class StatisticalAnalysis:
         Returns (t_statistic, p_value, warning_message).
         Uses approximation for p-value without scipy.
         """
-        n1 = len(values1)
-        n2 = len(values2)
+        arr1 = np.asarray(values1, dtype=np.float64)
+        arr2 = np.asarray(values2, dtype=np.float64)
+        n1 = arr1.size
+        n2 = arr2.size
 
         if n1 < 2 or n2 < 2:
             return 0.0, 1.0, "Insufficient samples (n < 2)"
 
-        mean1 = StatisticalAnalysis.mean(values1)
-        mean2 = StatisticalAnalysis.mean(values2)
-        var1 = StatisticalAnalysis.std(values1) ** 2
-        var2 = StatisticalAnalysis.std(values2) ** 2
+        mean1, mean2, var1, var2 = _welch_kernel(arr1, arr2)
+        return StatisticalAnalysis.welch_t_test_from_stats(
+            mean1, var1, n1, mean2, var2, n2
+        )
+
+    @staticmethod
+    def welch_t_test_from_stats(
+        mean1: float,
+        var1: float,
+        n1: int,
+        mean2: float,
+        var2: float,
+        n2: int,
+    ) -> tuple[float, float, str | None]:
+        """
+        Welch's t-test from precomputed group means and variances.
+
+        Lets callers that already hold the group statistics (e.g.
+        paired_analysis) skip the duplicate reduction passes.
+        """
+        if n1 < 2 or n2 < 2:
+            return 0.0, 1.0, "Insufficient samples (n < 2)"
 
         # MAJ-2 fix: Check for zero variance (all values identical)
         warning = None
@@ -119,82 +203,54 @@ class StatisticalAnalysis:
         # Standard error
         se = math.sqrt(var1 / n1 + var2 / n2)
 
-        if se == 0:
-            return 0.0, 1.0, "Zero standard error"
-
         # t-statistic
         t = (mean2 - mean1) / se
 
-        # Welch-Satterthwaite degrees of freedom
-        # Avoid division by zero when variance is 0
-        df_terms = []
-        if var1 > 0:
-            df_terms.append((var1 / n1) ** 2 / (n1 - 1))
-        if var2 > 0:
-            df_terms.append((var2 / n2) ** 2 / (n2 - 1))
-
-        df_num = (var1 / n1 + var2 / n2) ** 2
-        df_denom = sum(df_terms) if df_terms else 1
-        df = df_num / df_denom if df_denom != 0 else n1 + n2 - 2
-
         # Approximate p-value using normal distribution for large df
         # For small df, this is an approximation
-        p_value = 2 * (1 - StatisticalAnalysis._normal_cdf(abs(t)))
+        p_value = 2 * (1 - _normal_cdf(abs(t)))
 
         return t, p_value, warning
 
-    @staticmethod
-    def _normal_cdf(x: float) -> float:
-        """Approximate standard normal CDF."""
-        # Approximation using error function
-        return 0.5 * (1 + math.erf(x / math.sqrt(2)))
-
     def paired_analysis(
         self,
-        control_results: list[dict[str, Any]],
-        treatment_results: list[dict[str, Any]],
-        metric_key: str,
+        control_values: np.ndarray,
+        treatment_values: np.ndarray,
         metric_name: str,
     ) -> TTestResult:
         """
         Perform paired t-test analysis on a metric.
 
         Args:
-            control_results: Control group results
-            treatment_results: Treatment group results
-            metric_key: Key in metrics dict
+            control_values: Control group metric values (completed tasks only)
+            treatment_values: Treatment group metric values (completed tasks only)
             metric_name: Human-readable name
 
         Returns:
             TTestResult with statistical analysis
         """
-        # Extract values
-        control_values = [
-            r.get("metrics", {}).get(metric_key, 0.0)
-            for r in control_results
-            if r.get("status") == "completed"
-        ]
-
-        treatment_values = [
-            r.get("metrics", {}).get(metric_key, 0.0)
-            for r in treatment_results
-            if r.get("status") == "completed"
-        ]
-
-        # Calculate statistics
-        control_mean = self.mean(control_values)
-        treatment_mean = self.mean(treatment_values)
-        control_std = self.std(control_values)
-        treatment_std = self.std(treatment_values)
+        # Calculate each group's statistics exactly once; the t-test and
+        # effect size below reuse them instead of re-reducing the arrays.
+        n1 = control_values.size
+        n2 = treatment_values.size
+        control_mean = float(control_values.mean()) if n1 else 0.0
+        treatment_mean = float(treatment_values.mean()) if n2 else 0.0
+        control_var = float(control_values.var(ddof=1)) if n1 >= 2 else 0.0
+        treatment_var = float(treatment_values.var(ddof=1)) if n2 >= 2 else 0.0
+        control_std = math.sqrt(control_var)
+        treatment_std = math.sqrt(treatment_var)
 
         # Perform t-test (MAJ-2: now returns warning)
-        t_stat, p_value, warning = self.welch_t_test(control_values, treatment_values)
+        t_stat, p_value, warning = self.welch_t_test_from_stats(
+            control_mean, control_var, n1,
+            treatment_mean, treatment_var, n2,
+        )
 
         # Calculate effect size
         effect_size = self.cohens_d(
             control_mean, treatment_mean,
             control_std, treatment_std,
-            len(control_values), len(treatment_values),
+            n1, n2,
         )
 
         return TTestResult(
@@ -225,19 +281,16 @@ class StatisticalAnalysis:
         Returns:
             List of TTestResult for each metric
         """
-        metrics_to_analyze = [
-            ("tests_passed", "Tests Passed"),
-            ("hidden_tests_passed", "Hidden Tests Passed"),
-            ("iterations", "Iterations"),
-            ("total_tokens", "Total Tokens"),
-            ("lines_of_code", "Lines of Code"),
-            ("cyclomatic_complexity", "Cyclomatic Complexity"),
-        ]
+        # One pass per group converts the record-oriented results into
+        # columnar float64 arrays; each metric analysis then reduces over
+        # its own contiguous column.
+        control_columns = build_metric_columns(control_results)
+        treatment_columns = build_metric_columns(treatment_results)
 
         results = []
-        for key, name in metrics_to_analyze:
+        for key, name in _METRICS_TO_ANALYZE:
             result = self.paired_analysis(
-                control_results, treatment_results, key, name
+                control_columns[key], treatment_columns[key], name
             )
             results.append(result)
 
@@ -2,14 +2,26 @@
 Metrics calculation for benchmark evaluation.
 """
 
-from dataclasses import dataclass
+import operator
+import sys
+from dataclasses import asdict, dataclass
 from typing import Any
 
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional fast JSON parser
+    orjson = None
 
-@dataclass
+# Interned so status comparisons hit the pointer-equality fast path
+_STATUS_COMPLETED = sys.intern("completed")
+_STATUS_FAILED = sys.intern("failed")
+_STATUS_TIMEOUT = sys.intern("timeout")
+
+
+@dataclass(slots=True, frozen=True)
 class GroupMetrics:
     """Aggregated metrics for an experiment group."""
     group_name: str
@@ -39,24 +51,7 @@ class GroupMetrics:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "group_name": self.group_name,
-            "total_tasks": self.total_tasks,
-            "completed_tasks": self.completed_tasks,
-            "failed_tasks": self.failed_tasks,
-            "timeout_tasks": self.timeout_tasks,
-            "avg_test_pass_rate": self.avg_test_pass_rate,
-            "avg_hidden_test_pass_rate": self.avg_hidden_test_pass_rate,
-            "avg_iterations": self.avg_iterations,
-            "avg_tokens": self.avg_tokens,
-            "avg_execution_time": self.avg_execution_time,
-            "avg_lines_of_code": self.avg_lines_of_code,
-            "avg_complexity": self.avg_complexity,
-            "avg_contract_coverage": self.avg_contract_coverage,
-            "contracts_used_rate": self.contracts_used_rate,
-            "avg_guard_errors": self.avg_guard_errors,
-            "avg_guard_warnings": self.avg_guard_warnings,
-        }
+        return asdict(self)
 
 
 def calculate_metrics(results: list[dict[str, Any]], group_name: str) -> GroupMetrics:
@@ -90,65 +85,76 @@ def calculate_metrics(results: list[dict[str, Any]], group_name: str) -> GroupMe
             avg_guard_warnings=0.0,
         )
 
-    # Count by status
-    completed = [r for r in results if r.get("status") == "completed"]
-    failed = [r for r in results if r.get("status") == "failed"]
-    timeout = [r for r in results if r.get("status") == "timeout"]
-
-    # Calculate averages from completed tasks
-    def avg(key: str, default: float = 0.0) -> float:
-        if not completed:
-            return default
-        values = [r.get("metrics", {}).get(key, default) for r in completed]
-        return sum(values) / len(values)
-
-    # Test pass rates
-    def test_pass_rate(r: dict) -> float:
-        metrics = r.get("metrics", {})
-        total = metrics.get("tests_total", 0)
-        passed = metrics.get("tests_passed", 0)
-        return passed / total if total > 0 else 0.0
-
-    def hidden_pass_rate(r: dict) -> float:
-        metrics = r.get("metrics", {})
-        total = metrics.get("hidden_tests_total", 0)
-        passed = metrics.get("hidden_tests_passed", 0)
-        return passed / total if total > 0 else 0.0
-
-    avg_test_rate = (
-        sum(test_pass_rate(r) for r in completed) / len(completed)
-        if completed else 0.0
-    )
-
-    avg_hidden_rate = (
-        sum(hidden_pass_rate(r) for r in completed) / len(completed)
-        if completed else 0.0
-    )
-
-    # Contract usage rate
-    contracts_used = sum(
-        1 for r in completed
-        if r.get("metrics", {}).get("has_contracts", False)
-    )
-    contracts_rate = contracts_used / len(completed) if completed else 0.0
+    # Single pass over results: count statuses and accumulate running
+    # sums for every average, without materializing per-status lists
+    # (failed/timeout were only ever used for their len()).
+    n_completed = 0
+    n_failed = 0
+    n_timeout = 0
+
+    sum_test_rate = 0.0
+    sum_hidden_rate = 0.0
+    sum_iterations = 0.0
+    sum_tokens = 0.0
+    sum_execution_time = 0.0
+    sum_lines_of_code = 0.0
+    sum_complexity = 0.0
+    sum_contract_coverage = 0.0
+    sum_guard_errors = 0.0
+    sum_guard_warnings = 0.0
+    contracts_used = 0
+
+    for r in results:
+        status = r.get("status")
+        if status != _STATUS_COMPLETED:
+            if status == _STATUS_FAILED:
+                n_failed += 1
+            elif status == _STATUS_TIMEOUT:
+                n_timeout += 1
+            continue
+
+        n_completed += 1
+        m = r.get("metrics") or {}
+
+        tests_total = m.get("tests_total", 0)
+        if tests_total > 0:
+            sum_test_rate += m.get("tests_passed", 0) / tests_total
+
+        hidden_total = m.get("hidden_tests_total", 0)
+        if hidden_total > 0:
+            sum_hidden_rate += m.get("hidden_tests_passed", 0) / hidden_total
+
+        sum_iterations += m.get("iterations", 0.0)
+        sum_tokens += m.get("total_tokens", 0.0)
+        sum_execution_time += m.get("execution_time_seconds", 0.0)
+        sum_lines_of_code += m.get("lines_of_code", 0.0)
+        sum_complexity += m.get("cyclomatic_complexity", 0.0)
+        sum_contract_coverage += m.get("contract_coverage", 0.0)
+        sum_guard_errors += m.get("guard_errors", 0.0)
+        sum_guard_warnings += m.get("guard_warnings", 0.0)
+
+        if m.get("has_contracts", False):
+            contracts_used += 1
+
+    inv_n = 1.0 / n_completed if n_completed else 0.0
 
     return GroupMetrics(
         group_name=group_name,
         total_tasks=len(results),
-        completed_tasks=len(completed),
-        failed_tasks=len(failed),
-        timeout_tasks=len(timeout),
-        avg_test_pass_rate=avg_test_rate,
-        avg_hidden_test_pass_rate=avg_hidden_rate,
-        avg_iterations=avg("iterations"),
-        avg_tokens=avg("total_tokens"),
-        avg_execution_time=avg("execution_time_seconds"),
-        avg_lines_of_code=avg("lines_of_code"),
-        avg_complexity=avg("cyclomatic_complexity"),
-        avg_contract_coverage=avg("contract_coverage"),
-        contracts_used_rate=contracts_rate,
-        avg_guard_errors=avg("guard_errors"),
-        avg_guard_warnings=avg("guard_warnings"),
+        completed_tasks=n_completed,
+        failed_tasks=n_failed,
+        timeout_tasks=n_timeout,
+        avg_test_pass_rate=sum_test_rate * inv_n,
+        avg_hidden_test_pass_rate=sum_hidden_rate * inv_n,
+        avg_iterations=sum_iterations * inv_n,
+        avg_tokens=sum_tokens * inv_n,
+        avg_execution_time=sum_execution_time * inv_n,
+        avg_lines_of_code=sum_lines_of_code * inv_n,
+        avg_complexity=sum_complexity * inv_n,
+        avg_contract_coverage=sum_contract_coverage * inv_n,
+        contracts_used_rate=contracts_used * inv_n,
+        avg_guard_errors=sum_guard_errors * inv_n,
+        avg_guard_warnings=sum_guard_warnings * inv_n,
     )
 
 
@@ -174,6 +180,23 @@ class GroupComparison:
         }
 
 
+# Metrics to compare: (attribute, higher_is_better, display name)
+_COMPARISON_METRICS: tuple[tuple[str, bool, str], ...] = (
+    ("avg_test_pass_rate", True, "Test Pass Rate"),
+    ("avg_hidden_test_pass_rate", True, "Hidden Test Pass Rate"),
+    ("avg_iterations", False, "Iterations (lower is better)"),
+    ("avg_tokens", False, "Token Usage (lower is better)"),
+    ("avg_lines_of_code", False, "Lines of Code"),
+    ("avg_complexity", False, "Complexity (lower is better)"),
+)
+
+# One C-level multi-attribute fetch instead of 2 getattrs per metric
+_COMPARISON_GETTER = operator.attrgetter(*(attr for attr, _, _ in _COMPARISON_METRICS))
+
+# better_group keyed by sign(diff) adjusted for metric direction
+_BETTER_BY_SIGN = {1: "treatment", -1: "control", 0: "tie"}
+
+
 def compare_groups(
     control: GroupMetrics,
     treatment: GroupMetrics,
@@ -190,29 +213,19 @@ def compare_groups(
     """
     comparisons = []
 
-    # Define metrics to compare and whether higher is better
-    metrics_config = [
-        ("avg_test_pass_rate", True, "Test Pass Rate"),
-        ("avg_hidden_test_pass_rate", True, "Hidden Test Pass Rate"),
-        ("avg_iterations", False, "Iterations (lower is better)"),
-        ("avg_tokens", False, "Token Usage (lower is better)"),
-        ("avg_lines_of_code", False, "Lines of Code"),
-        ("avg_complexity", False, "Complexity (lower is better)"),
-    ]
-
-    for attr, higher_is_better, display_name in metrics_config:
-        control_val = getattr(control, attr)
-        treatment_val = getattr(treatment, attr)
+    control_vals = _COMPARISON_GETTER(control)
+    treatment_vals = _COMPARISON_GETTER(treatment)
 
+    for (_attr, higher_is_better, display_name), control_val, treatment_val in zip(
+        _COMPARISON_METRICS, control_vals, treatment_vals, strict=True
+    ):
         diff = treatment_val - control_val
         pct_change = (
             (diff / control_val * 100) if control_val != 0 else 0.0
         )
 
-        if higher_is_better:
-            better = "treatment" if diff > 0 else ("control" if diff < 0 else "tie")
-        else:
-            better = "treatment" if diff < 0 else ("control" if diff > 0 else "tie")
+        sign = (diff > 0) - (diff < 0)
+        better = _BETTER_BY_SIGN[sign if higher_is_better else -sign]
 
         comparisons.append(GroupComparison(
             metric_name=display_name,
@@ -236,5 +249,7 @@ def load_results(results_path: Path) -> dict[str, Any]:
     Returns:
         Results dictionary
     """
-    with open(results_path) as f:
-        return json.load(f)
+    data = results_path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
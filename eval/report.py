@@ -3,7 +3,9 @@ Report generation for benchmark results.
 """
 
 import argparse
+import hashlib
 import json
+import pickle
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -12,21 +14,29 @@ from eval.metrics import calculate_metrics, compare_groups, load_results
 from eval.analysis import StatisticalAnalysis
 
 
-def generate_report(results_path: Path, output_path: Path | None = None) -> str:
+def _compute_analysis(results_path: Path) -> tuple[Any, ...]:
     """
-    Generate a comprehensive report from experiment results.
+    Metrics, comparisons and t-tests for a results file, memoized on disk.
 
-    Args:
-        results_path: Path to results.json
-        output_path: Optional path to save report
+    The cache sidecar lives next to results.json and is keyed by a hash
+    of the file contents, so repeated generate_report runs (multi-format
+    output, report iteration) skip the statistical recomputation and
+    become a single pickle read.
 
     Returns:
-        Report as markdown string
+        (experiment_id, control_metrics, treatment_metrics, comparisons, stats)
     """
-    # Load results
+    digest = hashlib.blake2b(results_path.read_bytes(), digest_size=16).hexdigest()
+    cache_file = results_path.with_suffix(f".stats.{digest}.pkl")
+
+    if cache_file.exists():
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except Exception:
+            pass  # corrupt/stale cache: recompute below
+
     results = load_results(results_path)
 
-    # Calculate metrics
     control_metrics = calculate_metrics(
         results.get("control_results", []),
         "Control"
@@ -36,29 +46,45 @@ def generate_report(results_path: Path, output_path: Path | None = None) -> str:
         "Treatment"
     )
 
-    # Compare groups
     comparisons = compare_groups(control_metrics, treatment_metrics)
 
-    # Statistical analysis
-    analysis = StatisticalAnalysis()
-    stats = analysis.full_analysis(
+    stats = StatisticalAnalysis().full_analysis(
         results.get("control_results", []),
         results.get("treatment_results", []),
     )
 
-    # Generate report
-    report = []
+    payload = (
+        results.get("experiment_id", "unknown"),
+        control_metrics,
+        treatment_metrics,
+        comparisons,
+        stats,
+    )
+
+    try:
+        cache_file.write_bytes(pickle.dumps(payload))
+    except Exception:
+        pass  # cache is best-effort
+
+    return payload
+
+
+def generate_report(results_path: Path, output_path: Path | None = None) -> str:
+    """
+    Generate a comprehensive report from experiment results.
 
-    # Header
-    report.append("# Invar Benchmark Report")
-    report.append("")
-    report.append(f"**Experiment ID:** {results.get('experiment_id', 'unknown')}")
-    report.append(f"**Generated:** {datetime.now().isoformat()}")
-    report.append("")
+    Args:
+        results_path: Path to results.json
+        output_path: Optional path to save report
 
-    # Executive Summary
-    report.append("## Executive Summary")
-    report.append("")
+    Returns:
+        Report as markdown string
+    """
+    # Load results and run (or reuse) the statistical analysis
+    experiment_id, control_metrics, treatment_metrics, comparisons, stats = (
+        _compute_analysis(results_path)
+    )
+    analysis = StatisticalAnalysis()
 
     # Calculate overall improvement
     test_improvement = (
@@ -70,108 +96,112 @@ def generate_report(results_path: Path, output_path: Path | None = None) -> str:
         treatment_metrics.avg_iterations
     )
 
-    report.append(f"- **Tasks Completed:** Control {control_metrics.completed_tasks}/{control_metrics.total_tasks}, "
-                  f"Treatment {treatment_metrics.completed_tasks}/{treatment_metrics.total_tasks}")
-    report.append(f"- **Hidden Test Pass Rate Improvement:** {test_improvement:+.1%}")
-    report.append(f"- **Iteration Reduction:** {iteration_reduction:+.1f}")
-    report.append(f"- **Contract Usage Rate:** {treatment_metrics.contracts_used_rate:.1%}")
-    report.append("")
-
-    # Group Metrics Table
-    report.append("## Group Metrics")
-    report.append("")
-    report.append("| Metric | Control | Treatment | Δ |")
-    report.append("|--------|---------|-----------|---|")
-
-    for comp in comparisons:
-        icon = "✅" if comp.better_group == "treatment" else ("⚠️" if comp.better_group == "control" else "➖")
-        report.append(
-            f"| {comp.metric_name} | {comp.control_value:.2f} | "
-            f"{comp.treatment_value:.2f} | {icon} {comp.percent_change:+.1f}% |"
-        )
-
-    report.append("")
-
-    # Statistical Analysis
-    report.append("## Statistical Analysis")
-    report.append("")
-    report.append("| Metric | Control (μ±σ) | Treatment (μ±σ) | t | p | Effect | Sig? |")
-    report.append("|--------|---------------|-----------------|---|---|--------|------|")
-
-    for stat in stats:
-        sig_icon = "✓" if stat.significant else "✗"
-        effect_interp = analysis.interpret_effect_size(stat.effect_size)
-        report.append(
-            f"| {stat.metric_name} | "
-            f"{stat.control_mean:.2f}±{stat.control_std:.2f} | "
-            f"{stat.treatment_mean:.2f}±{stat.treatment_std:.2f} | "
-            f"{stat.t_statistic:.2f} | {stat.p_value:.3f} | "
-            f"{stat.effect_size:.2f} ({effect_interp}) | {sig_icon} |"
-        )
-
-    report.append("")
-
-    # Invar-Specific Metrics (Treatment Only)
-    report.append("## Invar-Specific Metrics (Treatment Group)")
-    report.append("")
-    report.append(f"- **Contract Coverage:** {treatment_metrics.avg_contract_coverage:.1%}")
-    report.append(f"- **Contracts Used:** {treatment_metrics.contracts_used_rate:.1%} of tasks")
-    report.append(f"- **Avg Guard Errors:** {treatment_metrics.avg_guard_errors:.1f}")
-    report.append(f"- **Avg Guard Warnings:** {treatment_metrics.avg_guard_warnings:.1f}")
-    report.append("")
-
-    # Conclusions
-    report.append("## Conclusions")
-    report.append("")
+    # Generate report: fixed blocks are single f-string templates, lists
+    # are only used for the loop-generated table rows, and everything is
+    # joined exactly once at the end.
+    header = f"""# Invar Benchmark Report
+
+**Experiment ID:** {experiment_id}
+**Generated:** {datetime.now().isoformat()}
+
+## Executive Summary
+
+- **Tasks Completed:** Control {control_metrics.completed_tasks}/{control_metrics.total_tasks}, \
+Treatment {treatment_metrics.completed_tasks}/{treatment_metrics.total_tasks}
+- **Hidden Test Pass Rate Improvement:** {test_improvement:+.1%}
+- **Iteration Reduction:** {iteration_reduction:+.1f}
+- **Contract Usage Rate:** {treatment_metrics.contracts_used_rate:.1%}
+
+## Group Metrics
+
+| Metric | Control | Treatment | Δ |
+|--------|---------|-----------|---|"""
+
+    comparison_rows = [
+        f"| {comp.metric_name} | {comp.control_value:.2f} | "
+        f"{comp.treatment_value:.2f} | "
+        f"{'✅' if comp.better_group == 'treatment' else ('⚠️' if comp.better_group == 'control' else '➖')} "
+        f"{comp.percent_change:+.1f}% |"
+        for comp in comparisons
+    ]
+
+    stats_header = """
+## Statistical Analysis
+
+| Metric | Control (μ±σ) | Treatment (μ±σ) | t | p | Effect | Sig? |
+|--------|---------------|-----------------|---|---|--------|------|"""
+
+    stat_rows = [
+        f"| {stat.metric_name} | "
+        f"{stat.control_mean:.2f}±{stat.control_std:.2f} | "
+        f"{stat.treatment_mean:.2f}±{stat.treatment_std:.2f} | "
+        f"{stat.t_statistic:.2f} | {stat.p_value:.3f} | "
+        f"{stat.effect_size:.2f} ({analysis.interpret_effect_size(stat.effect_size)}) | "
+        f"{'✓' if stat.significant else '✗'} |"
+        for stat in stats
+    ]
 
     # Determine overall verdict
     treatment_wins = sum(1 for c in comparisons if c.better_group == "treatment")
     control_wins = sum(1 for c in comparisons if c.better_group == "control")
 
     if treatment_wins > control_wins:
-        report.append("**Verdict:** Treatment group (with Invar) performed better overall.")
+        verdict = "**Verdict:** Treatment group (with Invar) performed better overall."
     elif control_wins > treatment_wins:
-        report.append("**Verdict:** Control group (without Invar) performed better overall.")
+        verdict = "**Verdict:** Control group (without Invar) performed better overall."
     else:
-        report.append("**Verdict:** Results are inconclusive - no clear winner.")
+        verdict = "**Verdict:** Results are inconclusive - no clear winner."
+
+    invar_and_verdict = f"""
+## Invar-Specific Metrics (Treatment Group)
+
+- **Contract Coverage:** {treatment_metrics.avg_contract_coverage:.1%}
+- **Contracts Used:** {treatment_metrics.contracts_used_rate:.1%} of tasks
+- **Avg Guard Errors:** {treatment_metrics.avg_guard_errors:.1f}
+- **Avg Guard Warnings:** {treatment_metrics.avg_guard_warnings:.1f}
+
+## Conclusions
+
+{verdict}
+"""
 
-    report.append("")
+    parts = [header, *comparison_rows, stats_header, *stat_rows, invar_and_verdict]
 
     # Significant findings
     significant_findings = [s for s in stats if s.significant]
     if significant_findings:
-        report.append("### Statistically Significant Findings")
-        report.append("")
+        parts.append("### Statistically Significant Findings")
+        parts.append("")
         for finding in significant_findings:
             direction = "higher" if finding.treatment_mean > finding.control_mean else "lower"
-            report.append(
+            parts.append(
                 f"- **{finding.metric_name}:** Treatment had significantly {direction} values "
                 f"(p={finding.p_value:.3f}, d={finding.effect_size:.2f})"
             )
-        report.append("")
+        parts.append("")
 
     # Recommendations
-    report.append("## Recommendations")
-    report.append("")
-    report.append("Based on the results:")
-    report.append("")
+    parts.append("## Recommendations")
+    parts.append("")
+    parts.append("Based on the results:")
+    parts.append("")
 
     if treatment_metrics.avg_hidden_test_pass_rate > control_metrics.avg_hidden_test_pass_rate:
-        report.append("1. **Code Correctness:** Invar improves code correctness as measured by hidden tests.")
+        parts.append("1. **Code Correctness:** Invar improves code correctness as measured by hidden tests.")
 
     if treatment_metrics.avg_iterations < control_metrics.avg_iterations:
-        report.append("2. **Efficiency:** Invar reduces the number of iterations needed to complete tasks.")
+        parts.append("2. **Efficiency:** Invar reduces the number of iterations needed to complete tasks.")
 
     if treatment_metrics.contracts_used_rate > 0.5:
-        report.append("3. **Contract Adoption:** High contract usage rate indicates good framework integration.")
+        parts.append("3. **Contract Adoption:** High contract usage rate indicates good framework integration.")
 
-    report.append("")
-    report.append("---")
-    report.append("")
-    report.append("*Report generated by Invar Benchmark Framework*")
+    parts.append("")
+    parts.append("---")
+    parts.append("")
+    parts.append("*Report generated by Invar Benchmark Framework*")
 
     # Join and save
-    report_text = "\n".join(report)
+    report_text = "\n".join(parts)
 
     if output_path:
         output_path.write_text(report_text)
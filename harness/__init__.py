@@ -11,6 +11,7 @@ from harness.collector import MetricsCollector
 from harness.conversation_parser import (
     ConversationMetrics,
     parse_workspace_conversation,
+    parse_workspaces_bulk,
     parse_conversation_file,
 )
 
@@ -23,5 +24,6 @@ __all__ = [
     "MetricsCollector",
     "ConversationMetrics",
     "parse_workspace_conversation",
+    "parse_workspaces_bulk",
     "parse_conversation_file",
 ]
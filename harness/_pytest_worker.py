@@ -0,0 +1,90 @@
+"""
+Long-lived pytest worker process.
+
+Spawned once per MetricsCollector so repeated test runs share a single
+interpreter and pytest import instead of paying the ~500ms startup cost
+per invocation. Speaks newline-delimited JSON on stdin/stdout; pytest's
+own terminal output is discarded so responses are the only stdout data:
+
+    request:  {"args": [...], "cwd": "/path/to/workspace"}
+    response: {"exit": 0, "passed": 3, "failed": 1}
+"""
+
+import json
+import os
+import sys
+
+
+class _CountPlugin:
+    """Collects pass/fail counts from pytest test reports."""
+
+    def __init__(self) -> None:
+        self.passed = 0
+        self.failed = 0
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if report.when == "call":
+            if report.passed:
+                self.passed += 1
+            elif report.failed:
+                self.failed += 1
+        elif report.failed:
+            # Setup/teardown errors count as failures
+            self.failed += 1
+
+
+def main() -> int:
+    import pytest
+
+    # pytest (and the code under test) write terminal output to stdout,
+    # but the protocol stream must carry exactly one JSON line per
+    # request. Keep a private dup of the real stdout for responses and
+    # point fd 1 at /dev/null so nothing can interleave with them —
+    # fd-level, because pytest's capture plugin redirects fd 1 itself.
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+            cwd = request["cwd"]
+            os.chdir(cwd)
+            # `python -m pytest` would put the workspace on sys.path;
+            # emulate that so solution imports resolve identically
+            sys.path.insert(0, cwd)
+            baseline_modules = set(sys.modules)
+
+            plugin = _CountPlugin()
+            exit_code = pytest.main(request["args"], plugins=[plugin])
+
+            # Drop modules the workspace under test imported so the next
+            # run (a different workspace) cannot see stale code
+            for name in set(sys.modules) - baseline_modules:
+                sys.modules.pop(name, None)
+            try:
+                sys.path.remove(cwd)
+            except ValueError:
+                pass
+
+            response = {
+                "exit": int(exit_code),
+                "passed": plugin.passed,
+                "failed": plugin.failed,
+            }
+        except Exception as exc:
+            response = {"exit": -1, "passed": 0, "failed": 0, "error": str(exc)}
+
+        protocol.write(json.dumps(response) + "\n")
+        protocol.flush()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,13 +2,163 @@
 Configuration management for benchmark framework.
 """
 
+import atexit
+import functools
 import hashlib
 import json
+import mmap
+import os
 import shutil
-from dataclasses import dataclass, field
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import pygit2
+except ImportError:  # optional in-process git backend
+    pygit2 = None
+
+# Background deletions started by _async_rmtree; drained at exit
+_rmtree_threads: list[threading.Thread] = []
+
+
+def _async_rmtree(path: Path) -> None:
+    """
+    Remove a directory tree without blocking the caller.
+
+    The tree is atomically renamed to a unique sibling (same
+    filesystem, so this is instant no matter how many files it holds)
+    and actually deleted from a daemon thread.  Large SWE-bench
+    worktrees would otherwise stall setup for seconds to minutes.
+    """
+    trash = path.with_name(f"{path.name}.trash.{os.getpid()}.{uuid.uuid4().hex}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        # Cross-device or permission oddity: delete in place
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(trash,),
+        kwargs={"ignore_errors": True},
+        daemon=True,
+    )
+    thread.start()
+    _rmtree_threads.append(thread)
+
+
+# Identity handed to git via environment instead of per-repo `git
+# config` subprocesses; author and committer both resolve from here
+_GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Invar Benchmark",
+    "GIT_AUTHOR_EMAIL": "benchmark@invar.local",
+    "GIT_COMMITTER_NAME": "Invar Benchmark",
+    "GIT_COMMITTER_EMAIL": "benchmark@invar.local",
+}
+
+
+def _git_env() -> dict[str, str]:
+    """Process environment with the benchmark git identity applied."""
+    return {**os.environ, **_GIT_IDENTITY}
+
+
+@atexit.register
+def _drain_rmtree_threads() -> None:
+    """Give in-flight deletions a moment to finish; never wedge shutdown."""
+    for thread in _rmtree_threads:
+        thread.join(timeout=5)
+
+
+def _copy_file_fast(src: str, dst: str, size: int | None = None) -> None:
+    """
+    Copy a regular file through file descriptors.
+
+    Uses os.sendfile where available so the bytes move kernel-to-kernel
+    without bouncing through a user-space buffer; falls back to a plain
+    read/write loop otherwise.
+    """
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        if size is None:
+            size = os.fstat(src_fd).st_size
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            if hasattr(os, "sendfile"):
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            else:
+                while chunk := os.read(src_fd, 1 << 20):
+                    os.write(dst_fd, chunk)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _fast_copytree(src: Path, dst: Path) -> None:
+    """
+    Copy a directory tree using os.scandir and fd-level file copies.
+
+    Each directory entry is stat'd exactly once (scandir caches the
+    result on the DirEntry), avoiding the double-stat pattern of the
+    generic shutil.copytree fallback.  Symlinks are skipped; the config
+    trees being copied contain none.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _fast_copytree(Path(entry.path), Path(target))
+            elif entry.is_file(follow_symlinks=False):
+                try:
+                    _copy_file_fast(
+                        entry.path, target, entry.stat(follow_symlinks=False).st_size
+                    )
+                    shutil.copystat(entry.path, target, follow_symlinks=False)
+                except OSError:
+                    # Unusual filesystems (or permission quirks): let
+                    # shutil handle it the slow, portable way
+                    shutil.copy2(entry.path, target)
+
+
+def _link_or_copy(src: "Path | str", dst: "Path | str") -> None:
+    """
+    Hard-link src to dst, copying only when linking is impossible.
+
+    On the same filesystem this shares the underlying inode, so the
+    "copy" moves zero bytes; cross-device (EXDEV) or restricted
+    filesystems fall back to the fd-level copy.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        _copy_file_fast(str(src), str(dst))
+
+
+def _link_tree(src: Path, dst: Path) -> None:
+    """Mirror a directory tree by hard-linking its regular files."""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _link_tree(Path(entry.path), Path(target))
+            elif entry.is_file(follow_symlinks=False):
+                _link_or_copy(entry.path, target)
+
 
 @dataclass
 class BenchmarkConfig:
@@ -39,47 +189,54 @@ class BenchmarkConfig:
     # natural_routing=False: Force /develop prefix (legacy, for debugging only)
     natural_routing: bool = True  # Default: fair benchmark mode
 
+    # Workspace setup
+    # link_configs=True: hard-link CLAUDE.md/INVAR.md/.invar into workspaces
+    # (zero-copy; edits in a workspace would reach the shared config, so
+    # disable this if agents are expected to mutate those files)
+    link_configs: bool = True
+
     # SWE-bench settings (BM-03)
     use_repo_cache: bool = True  # Cache bare repos for faster subsequent runs
     use_docker: bool = True  # Use Docker for SWE task execution (required for correct Python version)
     docker_timeout: int = 1800  # Docker evaluation timeout in seconds
+    docker_max_workers: int = 8  # Parallel workers for swebench Docker evaluation
 
-    @property
+    @functools.cached_property
     def configs_dir(self) -> Path:
         """Directory containing group configurations."""
         return self.benchmark_root / "configs"
 
-    @property
+    @functools.cached_property
     def control_config(self) -> Path:
         """Control group config directory."""
         return self.configs_dir / "control"
 
-    @property
+    @functools.cached_property
     def treatment_config(self) -> Path:
         """Treatment group config directory."""
         return self.configs_dir / "treatment"
 
-    @property
+    @functools.cached_property
     def tasks_dir(self) -> Path:
         """Directory containing task definitions."""
         return self.benchmark_root / "tasks"
 
-    @property
+    @functools.cached_property
     def workspace_dir(self) -> Path:
         """Directory for task execution."""
         return self.benchmark_root / "workspace"
 
-    @property
+    @functools.cached_property
     def results_dir(self) -> Path:
         """Directory for results storage."""
         return self.benchmark_root / "results"
 
-    @property
+    @functools.cached_property
     def cache_dir(self) -> Path:
         """Directory for caching (bare repos, Docker images, etc.)."""
         return self.benchmark_root / ".cache"
 
-    @property
+    @functools.cached_property
     def bare_repos_dir(self) -> Path:
         """Directory for cached bare git repositories."""
         return self.cache_dir / "bare_repos"
@@ -89,45 +246,31 @@ class BenchmarkConfig:
         return self.workspace_dir / group / task_id
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
+        """
+        Convert to dictionary for serialization.
+
+        Driven by dataclasses.fields, so new fields serialize without
+        touching this method; Path values become strings.
+        """
         return {
-            "benchmark_root": str(self.benchmark_root),
-            "invar_project": str(self.invar_project),
-            "max_iterations": self.max_iterations,
-            "timeout_seconds": self.timeout_seconds,
-            "parallel_tasks": self.parallel_tasks,
-            "claude_command": self.claude_command,
-            "claude_model": self.claude_model,
-            "use_print_mode": self.use_print_mode,
-            "execution_mode": self.execution_mode,
-            "max_turns": self.max_turns,
-            "interactive_timeout": self.interactive_timeout,
-            "natural_routing": self.natural_routing,
-            "use_repo_cache": self.use_repo_cache,
-            "use_docker": self.use_docker,
-            "docker_timeout": self.docker_timeout,
+            f.name: str(v) if isinstance(v := getattr(self, f.name), Path) else v
+            for f in fields(self)
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "BenchmarkConfig":
-        """Create from dictionary."""
-        return cls(
-            benchmark_root=Path(data.get("benchmark_root", ".")),
-            invar_project=Path(data.get("invar_project", ".")),
-            max_iterations=data.get("max_iterations", 10),
-            timeout_seconds=data.get("timeout_seconds", 600),
-            parallel_tasks=data.get("parallel_tasks", 1),
-            claude_command=data.get("claude_command", "claude"),
-            claude_model=data.get("claude_model", "sonnet"),
-            use_print_mode=data.get("use_print_mode", True),
-            execution_mode=data.get("execution_mode", "print"),
-            max_turns=data.get("max_turns", 50),
-            interactive_timeout=data.get("interactive_timeout", 600),
-            natural_routing=data.get("natural_routing", True),
-            use_repo_cache=data.get("use_repo_cache", True),
-            use_docker=data.get("use_docker", False),
-            docker_timeout=data.get("docker_timeout", 1800),
-        )
+        """
+        Create from dictionary.
+
+        Unknown keys are ignored and missing ones fall back to the
+        field defaults; Path fields are rebuilt from their strings.
+        """
+        kwargs: dict[str, Any] = {}
+        for f in fields(cls):
+            if f.name in data:
+                value = data[f.name]
+                kwargs[f.name] = Path(value) if f.type in (Path, "Path") else value
+        return cls(**kwargs)
 
 
 def setup_workspace(
@@ -150,16 +293,22 @@ def setup_workspace(
     """
     workspace = config.get_workspace_path(group, task_id)
 
-    # Clean existing workspace
+    # Clean existing workspace (off the critical path)
     if workspace.exists():
-        shutil.rmtree(workspace)
+        _async_rmtree(workspace)
 
     workspace.mkdir(parents=True)
 
-    # Create src directories
-    (workspace / "src" / "core").mkdir(parents=True)
-    (workspace / "src" / "shell").mkdir(parents=True)
-    (workspace / "tests").mkdir(parents=True)
+    # Create the fixed src/tests layout plus every initial-file parent
+    # in one deduplicated pass; sorting by depth guarantees parents are
+    # created before children so each mkdir is a single syscall
+    dirs = {
+        workspace / "src" / "core",
+        workspace / "src" / "shell",
+        workspace / "tests",
+    } | {(workspace / file_path).parent for file_path in initial_files}
+    for directory in sorted(dirs, key=lambda d: len(d.parts)):
+        directory.mkdir(parents=True, exist_ok=True)
 
     # Copy group-specific config
     if group == "control":
@@ -167,72 +316,92 @@ def setup_workspace(
     else:
         src_config = config.treatment_config
 
+    # Config files are read-only reference material for the agent;
+    # hard-linking makes their "copy" free when enabled
+    copy_file = _link_or_copy if config.link_configs else (
+        lambda src, dst: _copy_file_fast(str(src), str(dst))
+    )
+    copy_tree = _link_tree if config.link_configs else _fast_copytree
+
     # Copy CLAUDE.md
     claude_md = src_config / "CLAUDE.md"
     if claude_md.exists():
-        shutil.copy(claude_md, workspace / "CLAUDE.md")
+        copy_file(claude_md, workspace / "CLAUDE.md")
 
     # For treatment, copy additional Invar files
     if group == "treatment":
         # Copy INVAR.md
         invar_md = src_config / "INVAR.md"
         if invar_md.exists():
-            shutil.copy(invar_md, workspace / "INVAR.md")
+            copy_file(invar_md, workspace / "INVAR.md")
 
         # Copy .invar directory
         invar_dir = src_config / ".invar"
         if invar_dir.exists():
-            shutil.copytree(invar_dir, workspace / ".invar")
+            copy_tree(invar_dir, workspace / ".invar")
 
         # Copy .claude directory (skills definitions for Skill tool)
         # Critical: Without this, /develop and other skills won't work
         claude_dir = src_config / ".claude"
         if claude_dir.exists():
-            shutil.copytree(claude_dir, workspace / ".claude")
-
-    # Write initial task files
-    for file_path, content in initial_files.items():
-        full_path = workspace / file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content)
+            copy_tree(claude_dir, workspace / ".claude")
+
+    # Write initial task files (parents already exist; write_bytes
+    # skips the TextIOWrapper re-encode that write_text performs).
+    # CPython releases the GIL around os.write, so seed sets beyond a
+    # couple of files go through a thread pool to overlap the small
+    # open/write/close round-trips.
+    if len(initial_files) <= 2:
+        for file_path, content in initial_files.items():
+            (workspace / file_path).write_bytes(content.encode())
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2)) as executor:
+            list(executor.map(
+                lambda kv: (workspace / kv[0]).write_bytes(kv[1].encode()),
+                initial_files.items(),
+            ))
 
     # Initialize git repo for tracking changes
-    import subprocess
+    # When pygit2 is installed, the seed commit is created in-process
+    # against libgit2 — no fork+exec at all for this tiny repo
+    if pygit2 is not None:
+        try:
+            repo = pygit2.init_repository(str(workspace), bare=False, initial_head="main")
+            repo.index.add_all()
+            repo.index.write()
+            tree = repo.index.write_tree()
+            sig = pygit2.Signature("Invar Benchmark", "benchmark@invar.local")
+            repo.create_commit("HEAD", sig, sig, "Initial task setup", tree, [])
+            return workspace
+        except Exception:
+            # libgit2 hiccup: fall through to the subprocess path
+            pass
 
-    try:
-        subprocess.run(
-            ["git", "init"],
-            cwd=workspace,
-            capture_output=True,
-            check=True,
-        )
+    # Identity comes from the environment (CRIT-2 fix without the two
+    # `git config` subprocesses), so setup is three spawns, not five
+    env = _git_env()
 
-        # Configure local git user for this repo (CRIT-2 fix)
-        # This avoids requiring global git config
-        subprocess.run(
-            ["git", "config", "user.email", "benchmark@invar.local"],
-            cwd=workspace,
-            capture_output=True,
-            check=True,
-        )
+    try:
         subprocess.run(
-            ["git", "config", "user.name", "Invar Benchmark"],
+            ["git", "init", "-q"],
             cwd=workspace,
             capture_output=True,
             check=True,
+            env=env,
         )
-
         subprocess.run(
-            ["git", "add", "."],
+            ["git", "add", "-A"],
             cwd=workspace,
             capture_output=True,
             check=True,
+            env=env,
         )
         subprocess.run(
-            ["git", "commit", "-m", "Initial task setup"],
+            ["git", "commit", "-q", "-m", "Initial task setup"],
             cwd=workspace,
             capture_output=True,
             check=True,
+            env=env,
         )
     except subprocess.CalledProcessError:
         # Git initialization is optional - continue without it
@@ -241,13 +410,19 @@ def setup_workspace(
     return workspace
 
 
-def _get_or_create_bare_repo(config: BenchmarkConfig, repo: str) -> Path:
+def _get_or_create_bare_repo(
+    config: BenchmarkConfig,
+    repo: str,
+    commit: str | None = None,
+) -> Path:
     """
     Get or create a cached bare repository.
 
     Args:
         config: Benchmark configuration
         repo: Repository name (e.g., "astropy/astropy")
+        commit: Commit the caller needs; lets an up-to-date cache skip
+            the network round-trip entirely
 
     Returns:
         Path to the bare repository
@@ -255,8 +430,6 @@ def _get_or_create_bare_repo(config: BenchmarkConfig, repo: str) -> Path:
     Raises:
         RuntimeError: If clone fails
     """
-    import subprocess
-
     # Create cache directory if needed
     config.bare_repos_dir.mkdir(parents=True, exist_ok=True)
 
@@ -267,10 +440,28 @@ def _get_or_create_bare_repo(config: BenchmarkConfig, repo: str) -> Path:
     repo_url = f"https://github.com/{repo}.git"
 
     if bare_path.exists():
-        # Update existing bare repo
+        # If the cache already holds the commit the caller wants, skip
+        # the network entirely — the common case when rerunning a
+        # benchmark over the same SWE-bench split
+        if commit:
+            probe = subprocess.run(
+                ["git", "cat-file", "-e", f"{commit}^{{commit}}"],
+                cwd=bare_path,
+                capture_output=True,
+            )
+            if probe.returncode == 0:
+                return bare_path
+
+        # Update existing bare repo: fetch just the missing commit when
+        # we know it, everything otherwise
+        fetch_cmd = (
+            ["git", "fetch", "--depth=1", "origin", commit]
+            if commit
+            else ["git", "fetch", "--all", "--prune"]
+        )
         try:
             subprocess.run(
-                ["git", "fetch", "--all", "--prune"],
+                fetch_cmd,
                 cwd=bare_path,
                 capture_output=True,
                 text=True,
@@ -280,10 +471,13 @@ def _get_or_create_bare_repo(config: BenchmarkConfig, repo: str) -> Path:
             # Fetch failure is not critical - continue with cached version
             pass
     else:
-        # Create new bare clone
+        # Create new bare clone.  --filter=tree:0 transfers only the
+        # commit graph: trees and blobs for the one base_commit a task
+        # needs are fetched lazily at worktree checkout, so the initial
+        # clone of a large monorepo is seconds instead of minutes.
         try:
             subprocess.run(
-                ["git", "clone", "--bare", "--filter=blob:none", repo_url, str(bare_path)],
+                ["git", "clone", "--bare", "--filter=tree:0", "--no-tags", repo_url, str(bare_path)],
                 capture_output=True,
                 text=True,
                 check=True,
@@ -297,7 +491,12 @@ def _get_or_create_bare_repo(config: BenchmarkConfig, repo: str) -> Path:
     return bare_path
 
 
-def _create_worktree(bare_path: Path, worktree_path: Path, commit: str) -> None:
+def _create_worktree(
+    bare_path: Path,
+    worktree_path: Path,
+    commit: str,
+    sparse_paths: list[str] | None = None,
+) -> None:
     """
     Create a git worktree from a bare repository.
 
@@ -305,9 +504,9 @@ def _create_worktree(bare_path: Path, worktree_path: Path, commit: str) -> None:
         bare_path: Path to bare repository
         worktree_path: Path for the worktree
         commit: Commit hash to checkout
+        sparse_paths: Directories to materialize (cone mode); a full
+            checkout is done when None or empty
     """
-    import subprocess
-
     # Remove existing worktree directory if any
     if worktree_path.exists():
         shutil.rmtree(worktree_path)
@@ -319,25 +518,81 @@ def _create_worktree(bare_path: Path, worktree_path: Path, commit: str) -> None:
         capture_output=True,
     )
 
-    # Create worktree at specific commit
+    if commit != "HEAD":
+        # Treeless clones only hold the commit graph; a depth-1 fetch
+        # materializes the one commit the worktree needs.  Probe first
+        # so an already-present commit costs no network round-trip, and
+        # keep the fetch best-effort: if it fails (offline), worktree
+        # add below still resolves against whatever the clone holds.
+        probe = subprocess.run(
+            ["git", "cat-file", "-e", f"{commit}^{{commit}}"],
+            cwd=bare_path,
+            capture_output=True,
+        )
+        if probe.returncode != 0:
+            subprocess.run(
+                ["git", "fetch", "--depth=1", "origin", commit],
+                cwd=bare_path,
+                capture_output=True,
+                timeout=300,
+            )
+
+    # Create worktree at specific commit; identity is supplied via the
+    # environment, so no per-worktree `git config` spawns are needed
+    env = _git_env()
+
+    if not sparse_paths:
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", str(worktree_path), commit],
+            cwd=bare_path,
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+        return
+
+    # Sparse path: register the worktree without writing any files,
+    # restrict it to the directories the task touches, then check out.
+    # Cuts checkout I/O from the whole tree to a few directories.
     subprocess.run(
-        ["git", "worktree", "add", "--detach", str(worktree_path), commit],
+        ["git", "worktree", "add", "--no-checkout", "--detach", str(worktree_path), commit],
         cwd=bare_path,
         capture_output=True,
         text=True,
         check=True,
+        env=env,
     )
-
-    # Configure local git user in worktree
-    subprocess.run(
-        ["git", "config", "user.email", "benchmark@invar.local"],
-        cwd=worktree_path,
-        capture_output=True,
-    )
+    try:
+        subprocess.run(
+            ["git", "sparse-checkout", "init", "--cone"],
+            cwd=worktree_path,
+            capture_output=True,
+            check=True,
+            env=env,
+        )
+        subprocess.run(
+            ["git", "sparse-checkout", "set", *sparse_paths],
+            cwd=worktree_path,
+            capture_output=True,
+            check=True,
+            env=env,
+        )
+    except subprocess.CalledProcessError:
+        # Old git without cone mode: fall back to a full checkout
+        subprocess.run(
+            ["git", "sparse-checkout", "disable"],
+            cwd=worktree_path,
+            capture_output=True,
+            env=env,
+        )
     subprocess.run(
-        ["git", "config", "user.name", "Invar Benchmark"],
+        ["git", "checkout"],
         cwd=worktree_path,
         capture_output=True,
+        text=True,
+        check=True,
+        env=env,
     )
 
 
@@ -365,13 +620,11 @@ def setup_swe_workspace(
     Raises:
         RuntimeError: If git clone or checkout fails
     """
-    import subprocess
-
     workspace = config.get_workspace_path(group, task_id)
 
-    # Clean existing workspace
+    # Clean existing workspace (off the critical path)
     if workspace.exists():
-        shutil.rmtree(workspace)
+        _async_rmtree(workspace)
 
     workspace.mkdir(parents=True)
 
@@ -383,11 +636,20 @@ def setup_swe_workspace(
 
     repo_dir = workspace / "repo"
 
+    # Tasks that declare which files they touch only need those
+    # directories materialized (cone mode keeps root-level files too);
+    # anything else gets a full checkout
+    sparse_paths = sorted({
+        parent
+        for f in swe_metadata.get("modified_files") or []
+        if (parent := str(Path(f).parent)) != "."
+    })
+
     if config.use_repo_cache:
         # Use cached bare repo + worktree (fast for repeated runs)
         try:
-            bare_path = _get_or_create_bare_repo(config, repo)
-            _create_worktree(bare_path, repo_dir, base_commit or "HEAD")
+            bare_path = _get_or_create_bare_repo(config, repo, base_commit or None)
+            _create_worktree(bare_path, repo_dir, base_commit or "HEAD", sparse_paths)
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to create worktree for {repo}@{base_commit}: {e.stderr}")
     else:
@@ -410,27 +672,71 @@ def setup_swe_workspace(
                     capture_output=True,
                     text=True,
                     check=True,
+                    env=_git_env(),
                 )
 
-            subprocess.run(
-                ["git", "config", "user.email", "benchmark@invar.local"],
-                cwd=repo_dir,
-                capture_output=True,
-            )
-            subprocess.run(
-                ["git", "config", "user.name", "Invar Benchmark"],
-                cwd=repo_dir,
-                capture_output=True,
-            )
-
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to clone/checkout {repo}@{base_commit}: {e.stderr}")
         except subprocess.TimeoutExpired:
             raise RuntimeError(f"Clone timeout for {repo}")
 
-    # Optional: Install dependencies
-    has_setup = (repo_dir / "setup.py").exists() or (repo_dir / "pyproject.toml").exists()
-    if has_setup:
+    # Remaining stages are independent of each other: the pip install
+    # (usually the multi-minute one), the config copies and the tests/
+    # mkdir all run concurrently so setup takes ~max(stages) instead of
+    # their sum.  Each stage traps its own errors, so an optional copy
+    # failing never cancels the install.
+    def _install_deps() -> None:
+        has_setup = (repo_dir / "setup.py").exists() or (repo_dir / "pyproject.toml").exists()
+        if not has_setup:
+            return
+
+        # The install output for a given (repo, base_commit) is
+        # deterministic, so dependencies go into one shared --target
+        # directory that every worktree of that commit reuses: N
+        # parallel tasks pay for one pip run and one copy on disk.
+        install_key = hashlib.sha256(f"{repo}@{base_commit}".encode()).hexdigest()[:16]
+        target = config.cache_dir / "site-packages" / install_key
+        done_marker = target / ".complete"
+
+        if not done_marker.exists():
+            # O_EXCL lock file makes concurrent workers cooperate:
+            # one installs, the rest wait for the completion marker
+            target.parent.mkdir(parents=True, exist_ok=True)
+            lock_path = target.parent / f"{install_key}.lock"
+            try:
+                lock_fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                for _ in range(300):
+                    if done_marker.exists() or not lock_path.exists():
+                        break
+                    time.sleep(1)
+            else:
+                try:
+                    if not done_marker.exists():
+                        result = subprocess.run(
+                            ["pip", "install", "--target", str(target), "--quiet", "."],
+                            cwd=repo_dir,
+                            capture_output=True,
+                            text=True,
+                            timeout=300,
+                        )
+                        if result.returncode == 0:
+                            done_marker.touch()
+                finally:
+                    os.close(lock_fd)
+                    lock_path.unlink(missing_ok=True)
+
+        if done_marker.exists():
+            # Record the shared install location; shared_deps_env() turns
+            # it into a PYTHONPATH entry for every subprocess run in this
+            # workspace. sys.path appending keeps the checked-out repo
+            # ahead of the shared install, so agent edits win while
+            # dependencies resolve from the shared directory.
+            (workspace / ".site-packages").write_text(str(target))
+            return
+
+        # Shared install failed (offline, build error): fall back to a
+        # plain editable install in the active environment
         try:
             subprocess.run(
                 ["pip", "install", "-e", ".", "--quiet"],
@@ -442,36 +748,105 @@ def setup_swe_workspace(
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
             pass
 
-    # Copy group-specific config to workspace (not repo dir)
-    if group == "control":
-        src_config = config.control_config
-    else:
-        src_config = config.treatment_config
+    def _copy_configs() -> None:
+        # Copy group-specific config to workspace (not repo dir)
+        if group == "control":
+            src_config = config.control_config
+        else:
+            src_config = config.treatment_config
 
-    # Copy CLAUDE.md to workspace root
-    claude_md = src_config / "CLAUDE.md"
-    if claude_md.exists():
-        shutil.copy(claude_md, workspace / "CLAUDE.md")
+        copy_file = _link_or_copy if config.link_configs else (
+            lambda src, dst: _copy_file_fast(str(src), str(dst))
+        )
+        copy_tree = _link_tree if config.link_configs else _fast_copytree
+
+        # Copy CLAUDE.md to workspace root
+        claude_md = src_config / "CLAUDE.md"
+        if claude_md.exists():
+            copy_file(claude_md, workspace / "CLAUDE.md")
+
+        # For treatment, copy additional Invar files
+        if group == "treatment":
+            invar_md = src_config / "INVAR.md"
+            if invar_md.exists():
+                copy_file(invar_md, workspace / "INVAR.md")
+
+            invar_dir = src_config / ".invar"
+            if invar_dir.exists():
+                copy_tree(invar_dir, workspace / ".invar")
+
+            # Copy .claude directory (skills definitions for Skill tool)
+            claude_dir = src_config / ".claude"
+            if claude_dir.exists():
+                copy_tree(claude_dir, workspace / ".claude")
+
+    def _make_tests_dir() -> None:
+        # Create tests directory for hidden tests
+        (workspace / "tests").mkdir(exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(_install_deps),
+            executor.submit(_copy_configs),
+            executor.submit(_make_tests_dir),
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception:
+                # Optional stages are best-effort; the repo checkout
+                # above already validated the parts that must succeed
+                pass
 
-    # For treatment, copy additional Invar files
-    if group == "treatment":
-        invar_md = src_config / "INVAR.md"
-        if invar_md.exists():
-            shutil.copy(invar_md, workspace / "INVAR.md")
+    return workspace
 
-        invar_dir = src_config / ".invar"
-        if invar_dir.exists():
-            shutil.copytree(invar_dir, workspace / ".invar")
 
-        # Copy .claude directory (skills definitions for Skill tool)
-        claude_dir = src_config / ".claude"
-        if claude_dir.exists():
-            shutil.copytree(claude_dir, workspace / ".claude")
+def shared_deps_env(workspace: Path) -> dict[str, str] | None:
+    """
+    Process environment exposing the workspace's shared dependencies.
 
-    # Create tests directory for hidden tests
-    (workspace / "tests").mkdir(exist_ok=True)
+    setup_swe_workspace records the shared --target site-packages
+    directory in a .site-packages marker; this appends it to PYTHONPATH
+    so pytest and agent subprocesses can import the repo's third-party
+    dependencies without a per-workspace install.
 
-    return workspace
+    Returns:
+        An environment dict for subprocess env=, or None when the
+        workspace has no shared install (inherit the parent env).
+    """
+    marker = workspace / ".site-packages"
+    if not marker.exists():
+        return None
+    try:
+        target = marker.read_text().strip()
+    except OSError:
+        return None
+    if not target or not Path(target).is_dir():
+        return None
+    env = os.environ.copy()
+    existing = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = f"{existing}{os.pathsep}{target}" if existing else target
+    return env
+
+
+def _dir_size(path: "Path | str") -> int:
+    """
+    Total size in bytes of all regular files under path.
+
+    scandir caches file type and stat on each DirEntry, so this walk
+    costs one stat per entry where rglob + is_file + stat cost two.
+    """
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    total += _dir_size(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+    return total
 
 
 def get_cache_stats(config: BenchmarkConfig) -> dict[str, Any]:
@@ -493,21 +868,28 @@ def get_cache_stats(config: BenchmarkConfig) -> dict[str, Any]:
     if not config.bare_repos_dir.exists():
         return stats
 
-    for repo_path in config.bare_repos_dir.iterdir():
-        if repo_path.is_dir() and repo_path.name.endswith(".git"):
-            # Calculate size
-            size_bytes = sum(f.stat().st_size for f in repo_path.rglob("*") if f.is_file())
-            size_mb = size_bytes / (1024 * 1024)
+    repo_paths = [
+        p for p in config.bare_repos_dir.iterdir()
+        if p.is_dir() and p.name.endswith(".git")
+    ]
+
+    # Walk the repos concurrently; each sits in its own subtree, so the
+    # directory-read latency of N repos overlaps instead of summing
+    with ThreadPoolExecutor(max_workers=min(16, len(repo_paths) or 1)) as executor:
+        sizes = list(executor.map(_dir_size, repo_paths))
+
+    for repo_path, size_bytes in zip(repo_paths, sizes):
+        size_mb = size_bytes / (1024 * 1024)
 
-            # Get repo name from path
-            repo_name = repo_path.name.replace("__", "/").replace(".git", "")
+        # Get repo name from path
+        repo_name = repo_path.name.replace("__", "/").replace(".git", "")
 
-            stats["repos"].append({
-                "name": repo_name,
-                "path": str(repo_path),
-                "size_mb": round(size_mb, 2),
-            })
-            stats["total_size_mb"] += size_mb
+        stats["repos"].append({
+            "name": repo_name,
+            "path": str(repo_path),
+            "size_mb": round(size_mb, 2),
+        })
+        stats["total_size_mb"] += size_mb
 
     stats["total_size_mb"] = round(stats["total_size_mb"], 2)
     return stats
@@ -524,8 +906,6 @@ def clear_cache(config: BenchmarkConfig, repo: str | None = None) -> int:
     Returns:
         Number of repos cleared
     """
-    import subprocess
-
     if not config.bare_repos_dir.exists():
         return 0
 
@@ -550,41 +930,153 @@ def clear_cache(config: BenchmarkConfig, repo: str | None = None) -> int:
             shutil.rmtree(bare_path)
             cleared = 1
     else:
-        # Clear all repos
-        for repo_path in config.bare_repos_dir.iterdir():
-            if repo_path.is_dir() and repo_path.name.endswith(".git"):
-                try:
-                    subprocess.run(
-                        ["git", "worktree", "prune"],
-                        cwd=repo_path,
-                        capture_output=True,
-                    )
-                except Exception:
-                    pass
+        # Clear all repos; the GB-scale deletions run concurrently so
+        # total time tends toward the slowest repo, not the sum
+        repo_paths = [
+            p for p in config.bare_repos_dir.iterdir()
+            if p.is_dir() and p.name.endswith(".git")
+        ]
+
+        def _clear_one(repo_path: Path) -> None:
+            subprocess.run(
+                ["git", "worktree", "prune"],
+                cwd=repo_path,
+                capture_output=True,
+            )
+            shutil.rmtree(repo_path, ignore_errors=True)
 
-                shutil.rmtree(repo_path)
-                cleared += 1
+        if repo_paths:
+            with ThreadPoolExecutor(max_workers=min(8, len(repo_paths))) as executor:
+                list(executor.map(_clear_one, repo_paths))
+
+        cleared = len(repo_paths)
 
     return cleared
 
 
-def get_config_hash(config_dir: Path) -> str:
+# Files above this size are hashed through mmap instead of read loops
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _hash_file_into(hasher: "hashlib._Hash", file_path: Path) -> None:
+    """
+    Feed one file into a hasher at constant memory.
+
+    Large files are mapped and handed to hashlib as a single buffer;
+    small files go through a 64 KiB read loop.  Either way no full-file
+    copy lands on the Python heap the way read_bytes() would.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            while chunk := f.read(65536):
+                hasher.update(chunk)
+
+
+def _tree_signature(config_dir: Path) -> str:
+    """
+    Cheap fingerprint of a config tree from (path, mtime_ns, size).
+
+    One scandir pass, no file contents read — stat results come cached
+    on the DirEntry.  Matches the file filter used by the content hash
+    below (non-hidden files, hidden directories still traversed).
+    """
+    lines = []
+    stack = [str(config_dir)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and not entry.name.startswith("."):
+                        st = entry.stat(follow_symlinks=False)
+                        lines.append(f"{entry.path}\0{st.st_mtime_ns}\0{st.st_size}")
+        except OSError:
+            continue
+    lines.sort()
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+
+# signature -> 12-hex content digest, process-local
+_config_hash_cache: dict[str, str] = {}
+
+
+def get_config_hash(config_dir: Path, cache_dir: Path | None = None) -> str:
     """
     Calculate hash of configuration files for versioning.
 
+    A stat-level signature of the tree is checked first (in memory and,
+    when cache_dir is given, in cache_dir/.hashcache.json), so unchanged
+    config trees skip rehashing their contents entirely.
+
     Args:
         config_dir: Directory containing config files
+        cache_dir: Optional directory holding the persistent hash cache
 
     Returns:
         SHA256 hash of all config files
     """
+    signature = _tree_signature(config_dir)
+
+    cached = _config_hash_cache.get(signature)
+    if cached is not None:
+        return cached
+
+    cache_file = cache_dir / ".hashcache.json" if cache_dir else None
+    disk_cache: dict[str, str] = {}
+    if cache_file is not None and cache_file.exists():
+        try:
+            disk_cache = json.loads(cache_file.read_text())
+            cached = disk_cache.get(signature)
+            if cached is not None:
+                _config_hash_cache[signature] = cached
+                return cached
+        except Exception:
+            disk_cache = {}
+
     hasher = hashlib.sha256()
 
-    for file_path in sorted(config_dir.rglob("*")):
-        if file_path.is_file() and not file_path.name.startswith("."):
-            hasher.update(file_path.read_bytes())
+    files = [
+        p for p in sorted(config_dir.rglob("*"))
+        if p.is_file() and not p.name.startswith(".")
+    ]
+
+    # Threads prefetch file contents concurrently (reads and hashlib
+    # both release the GIL) while the single hasher consumes them on
+    # this thread in sorted order, keeping the digest deterministic.
+    # Oversized files come back as None and are mmap-hashed here so
+    # they never sit fully buffered in memory.
+    def _prefetch(p: Path) -> bytes | None:
+        return p.read_bytes() if p.stat().st_size <= _MMAP_THRESHOLD else None
+
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2)) as executor:
+        for file_path, buf in zip(files, executor.map(_prefetch, files)):
+            # Mix in the relative path so renames change the digest,
+            # not just content edits
+            hasher.update(
+                str(file_path.relative_to(config_dir)).encode() + b"\0"
+            )
+            if buf is None:
+                _hash_file_into(hasher, file_path)
+            else:
+                hasher.update(buf)
+
+    digest = hasher.hexdigest()[:12]
+    _config_hash_cache[signature] = digest
+
+    if cache_file is not None:
+        try:
+            disk_cache[signature] = digest
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(disk_cache))
+        except Exception:
+            pass  # persistence is best-effort
 
-    return hasher.hexdigest()[:12]
+    return digest
 
 
 def create_experiment_metadata(config: BenchmarkConfig) -> dict[str, Any]:
@@ -597,30 +1089,26 @@ def create_experiment_metadata(config: BenchmarkConfig) -> dict[str, Any]:
     Returns:
         Dictionary with experiment metadata
     """
-    import subprocess
-    from datetime import datetime
-
-    # Get Claude Code version
-    try:
-        result = subprocess.run(
-            [config.claude_command, "--version"],
-            capture_output=True,
-            text=True,
-        )
-        claude_version = result.stdout.strip() if result.returncode == 0 else "unknown"
-    except Exception:
-        claude_version = "unknown"
+    # Probe both tool versions concurrently; each launcher can take
+    # hundreds of ms to start, so this costs max() instead of sum().
+    # The timeout also stops a wedged launcher hanging metadata creation.
+    def _probe_version(cmd: list[str]) -> str:
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            return result.stdout.strip() if result.returncode == 0 else "unknown"
+        except Exception:
+            return "unknown"
 
-    # Get Invar version
-    try:
-        result = subprocess.run(
-            ["invar", "--version"],
-            capture_output=True,
-            text=True,
-        )
-        invar_version = result.stdout.strip() if result.returncode == 0 else "unknown"
-    except Exception:
-        invar_version = "unknown"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        claude_future = executor.submit(_probe_version, [config.claude_command, "--version"])
+        invar_future = executor.submit(_probe_version, ["invar", "--version"])
+        claude_version = claude_future.result()
+        invar_version = invar_future.result()
 
     return {
         "timestamp": datetime.now().isoformat(),
@@ -628,7 +1116,7 @@ def create_experiment_metadata(config: BenchmarkConfig) -> dict[str, Any]:
         "invar_version": invar_version,
         "config": config.to_dict(),
         "config_hashes": {
-            "control": get_config_hash(config.control_config),
-            "treatment": get_config_hash(config.treatment_config),
+            "control": get_config_hash(config.control_config, config.cache_dir),
+            "treatment": get_config_hash(config.treatment_config, config.cache_dir),
         },
     }
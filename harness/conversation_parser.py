@@ -11,16 +11,44 @@ This module extracts accurate metrics from these logs including:
 - Invar protocol adherence (Check-In, Final)
 """
 
+import functools
 import json
 import os
 import re
-from collections import Counter
-from dataclasses import dataclass, field
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional fast JSON parser
+    orjson = None
 
-@dataclass
+try:
+    import msgspec.json as _msgspec_json
+except ImportError:  # optional, fastest JSON parser of the three
+    _msgspec_json = None
+
+# Invar protocol markers, compiled once.  The Final pattern folds the
+# presence check and the status extraction into a single search: group
+# 1 carries PASS/FAIL (case-insensitively) when present on the line.
+_CHECKIN_RE = re.compile(r'^✓?\s*Check-In:', re.MULTILINE)
+_FINAL_RE = re.compile(r'^✓?\s*Final:(?:.*?((?i:PASS|FAIL)))?', re.MULTILINE)
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp.
+
+    On Python 3.11+ (which this project requires) fromisoformat accepts
+    the 'Z' suffix directly, so no string substitution is needed.
+    """
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class ConversationMetrics:
     """Metrics extracted from a Claude conversation log."""
 
@@ -75,35 +103,25 @@ class ConversationMetrics:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "input_tokens": self.input_tokens,
-            "output_tokens": self.output_tokens,
-            "cache_creation_tokens": self.cache_creation_tokens,
-            "cache_read_tokens": self.cache_read_tokens,
-            "total_tokens": self.total_tokens,
-            "billable_tokens": self.billable_tokens,
-            "assistant_messages": self.assistant_messages,
-            "user_messages": self.user_messages,
-            "total_turns": self.total_turns,
-            "tool_uses": self.tool_uses,
-            "total_tool_calls": self.total_tool_calls,
-            "mcp_calls": self.mcp_calls,
-            "total_mcp_calls": self.total_mcp_calls,
-            "skill_calls": self.skill_calls,
-            "has_checkin": self.has_checkin,
-            "has_final": self.has_final,
-            "final_status": self.final_status,
-            "first_message_time": self.first_message_time,
-            "last_message_time": self.last_message_time,
-            "messages": self.messages,
-        }
+        d = {name: getattr(self, name) for name in _METRIC_FIELDS}
+        d["total_tokens"] = self.total_tokens
+        d["billable_tokens"] = self.billable_tokens
+        return d
 
 
+# Field names resolved once at import; to_dict iterates these instead
+# of hand-listing every attribute (which had already drifted from the
+# dataclass once).
+_METRIC_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(ConversationMetrics))
+
+
+@functools.lru_cache(maxsize=None)
 def get_claude_projects_dir() -> Path:
     """Get the Claude projects directory."""
     return Path.home() / ".claude" / "projects"
 
 
+@functools.lru_cache(maxsize=None)
 def workspace_to_project_name(workspace: Path) -> str:
     """
     Convert a workspace path to Claude's project directory name.
@@ -139,82 +157,115 @@ def find_conversation_file(
     Returns:
         Path to the matching conversation JSONL file, or None if not found
     """
-    from datetime import datetime
-
     projects_dir = get_claude_projects_dir()
     project_name = workspace_to_project_name(workspace)
     project_dir = projects_dir / project_name
 
-    if not project_dir.exists():
+    # Find all non-agent JSONL files (agent-* files are subagent logs).
+    # scandir's DirEntry carries the stat result, so each file is
+    # stat'd once here instead of again for every mtime/size lookup.
+    jsonl_files: list[tuple[Path, float, int]] = []
+    try:
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".jsonl") or entry.name.startswith("agent-"):
+                    continue
+                st = entry.stat()
+                jsonl_files.append((Path(entry.path), st.st_mtime, st.st_size))
+    except OSError:
         return None
 
-    # Find all non-agent JSONL files (agent-* files are subagent logs)
-    jsonl_files = [
-        f for f in project_dir.glob("*.jsonl")
-        if not f.name.startswith("agent-")
-    ]
-
     if not jsonl_files:
         return None
 
-    # If time window specified, filter files
+    # If time window specified, filter files.  The window bounds are
+    # constant across files, so parse them once up front.
     if start_time or end_time:
-        filtered = []
-        for f in jsonl_files:
-            mtime = datetime.fromtimestamp(f.stat().st_mtime)
-
-            if start_time:
-                try:
-                    start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    # Remove timezone for comparison
-                    start_dt = start_dt.replace(tzinfo=None)
-                    if mtime < start_dt:
-                        continue
-                except ValueError:
-                    pass
-
-            if end_time:
-                try:
-                    end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                    end_dt = end_dt.replace(tzinfo=None)
-                    # Add buffer for tasks that complete shortly after recorded end time
-                    from datetime import timedelta
-                    if mtime > end_dt + timedelta(minutes=5):
-                        continue
-                except ValueError:
-                    pass
+        start_dt = end_dt = None
+        if start_time:
+            try:
+                # Remove timezone for comparison
+                start_dt = _parse_iso(start_time).replace(tzinfo=None)
+            except ValueError:
+                pass
+        if end_time:
+            try:
+                # Add buffer for tasks that complete shortly after recorded end time
+                end_dt = _parse_iso(end_time).replace(tzinfo=None) + timedelta(minutes=5)
+            except ValueError:
+                pass
 
-            filtered.append(f)
+        filtered = []
+        for path, mtime_ts, size in jsonl_files:
+            mtime = datetime.fromtimestamp(mtime_ts)
+            if start_dt is not None and mtime < start_dt:
+                continue
+            if end_dt is not None and mtime > end_dt:
+                continue
+            filtered.append((path, size))
 
         if filtered:
             # Return the largest file in the time window (likely the main conversation)
-            return max(filtered, key=lambda f: f.stat().st_size)
+            return max(filtered, key=lambda item: item[1])[0]
 
     # Fallback: return most recently modified file
-    return max(jsonl_files, key=lambda f: f.stat().st_mtime)
+    return max(jsonl_files, key=lambda item: item[1])[0]
 
 
-def parse_conversation_file(filepath: Path) -> ConversationMetrics:
+def parse_conversation_file(
+    filepath: Path,
+    capture_messages: bool = False,
+) -> ConversationMetrics:
     """
     Parse a Claude conversation JSONL file and extract metrics.
 
     Args:
         filepath: Path to the .jsonl conversation file
+        capture_messages: Store truncated message content on the
+            metrics. Off by default — most callers only need the
+            token/tool statistics, and the message text is by far the
+            largest memory consumer here.
 
     Returns:
         ConversationMetrics with extracted data
     """
     metrics = ConversationMetrics()
-    tool_counts: Counter = Counter()
-    mcp_counts: Counter = Counter()
-
-    with open(filepath, 'r') as f:
-        for line in f:
+    tool_counts: dict[str, int] = defaultdict(int)
+    mcp_counts: dict[str, int] = defaultdict(int)
+
+    # Binary mode + a fast decoder: lines go to the parser as raw
+    # bytes, with no per-line str decode or .strip() allocation.  All
+    # three decoders tolerate surrounding whitespace and raise
+    # ValueError subclasses on malformed input.
+    if _msgspec_json is not None:
+        loads = _msgspec_json.decode
+    elif orjson is not None:
+        loads = orjson.loads
+    else:
+        loads = json.loads
+
+    # Read in 1 MiB chunks and split on newlines ourselves, carrying
+    # any trailing partial line into the next chunk.  Multi-MB logs
+    # stream through a fixed-size buffer instead of the line iterator's
+    # per-line readahead bookkeeping.
+    with open(filepath, 'rb') as f:
+        tail = b""
+        while chunk := f.read(1 << 20):
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            for line in lines:
+                if not line:
+                    continue
+                try:
+                    data = loads(line)
+                    _process_log_entry(data, metrics, tool_counts, mcp_counts, capture_messages)
+                except ValueError:
+                    continue
+        if tail:
             try:
-                data = json.loads(line.strip())
-                _process_log_entry(data, metrics, tool_counts, mcp_counts)
-            except json.JSONDecodeError:
-                continue
+                _process_log_entry(loads(tail), metrics, tool_counts, mcp_counts, capture_messages)
+            except ValueError:
+                pass
 
     # Finalize counters
     metrics.tool_uses = dict(tool_counts)
@@ -231,8 +282,9 @@ def parse_conversation_file(filepath: Path) -> ConversationMetrics:
 def _process_log_entry(
     data: dict[str, Any],
     metrics: ConversationMetrics,
-    tool_counts: Counter,
-    mcp_counts: Counter,
+    tool_counts: dict[str, int],
+    mcp_counts: dict[str, int],
+    capture_messages: bool = False,
 ) -> None:
     """Process a single log entry and update metrics."""
     entry_type = data.get('type', '')
@@ -245,13 +297,14 @@ def _process_log_entry(
         metrics.last_message_time = timestamp
 
         # Extract user message content
-        msg = data.get('message', {})
-        content = msg.get('content', '')
-        if isinstance(content, str) and content:
-            metrics.messages.append({
-                'role': 'user',
-                'content': content[:5000],  # Truncate for storage
-            })
+        if capture_messages:
+            msg = data.get('message', {})
+            content = msg.get('content', '')
+            if isinstance(content, str) and content:
+                metrics.messages.append({
+                    'role': 'user',
+                    'content': content[:5000],  # Truncate for storage
+                })
 
     elif entry_type == 'assistant':
         metrics.assistant_messages += 1
@@ -270,11 +323,19 @@ def _process_log_entry(
         # Process content blocks
         content = msg.get('content', [])
         text_parts = []
-        if isinstance(content, list):
+        text_len = 0
+        # Once the conversation has produced both markers and a Final
+        # status there is nothing left for the scanners to find; skip
+        # them for all remaining blocks and messages.
+        scan_markers = not (
+            metrics.has_checkin and metrics.has_final and metrics.final_status
+        )
+        # Claude's schema guarantees assistant content is a list of
+        # dict blocks; instead of isinstance-checking every block in
+        # the hot loop, trust the shape and let one except catch the
+        # rare malformed entry (string content, non-dict block).
+        try:
             for block in content:
-                if not isinstance(block, dict):
-                    continue
-
                 block_type = block.get('type', '')
 
                 if block_type == 'tool_use':
@@ -286,25 +347,45 @@ def _process_log_entry(
                         mcp_counts[tool_name] += 1
 
                     # Track Skill invocations
-                    if tool_name == 'Skill':
+                    elif tool_name == 'Skill':
                         metrics.skill_calls += 1
 
                 elif block_type == 'text':
                     text = block.get('text', '')
-                    text_parts.append(text)
+                    # Only accumulate until the 5000-char storage cap is
+                    # reached; anything past it would be thrown away by
+                    # the truncation below anyway.
+                    if capture_messages and text_len < 5000:
+                        text_parts.append(text)
+                        text_len += len(text) + 1  # account for '\n' join
+
+                    if not scan_markers:
+                        continue
 
-                    # Check for Invar protocol markers (strict patterns)
+                    # Check for Invar protocol markers (strict patterns).
+                    # A literal substring test is far cheaper than the
+                    # regex engine on the (common) negative answer, so
+                    # only blocks containing the marker hit the regex.
                     # Check-In format: "✓ Check-In:" or "Check-In:" at line start
-                    if re.search(r'^✓?\s*Check-In:', text, re.MULTILINE):
+                    if (
+                        not metrics.has_checkin
+                        and 'Check-In:' in text
+                        and _CHECKIN_RE.search(text)
+                    ):
                         metrics.has_checkin = True
 
                     # Final format: "✓ Final:" or "Final:" followed by status
-                    if re.search(r'^✓?\s*Final:', text, re.MULTILINE):
-                        metrics.has_final = True
-                        # Extract status from same line
-                        final_match = re.search(r'^✓?\s*Final:.*?(PASS|FAIL)', text, re.MULTILINE | re.IGNORECASE)
+                    if 'Final:' in text:
+                        final_match = _FINAL_RE.search(text)
                         if final_match:
-                            metrics.final_status = final_match.group(1).upper()
+                            metrics.has_final = True
+                            if final_match.group(1):
+                                metrics.final_status = final_match.group(1).upper()
+
+                    if metrics.has_checkin and metrics.has_final and metrics.final_status:
+                        scan_markers = False
+        except (TypeError, AttributeError):
+            pass
 
         # Store assistant message content
         if text_parts:
@@ -319,6 +400,7 @@ def parse_workspace_conversation(
     workspace: Path,
     start_time: str | None = None,
     end_time: str | None = None,
+    capture_messages: bool = False,
 ) -> ConversationMetrics | None:
     """
     Parse conversation metrics for a workspace.
@@ -327,6 +409,7 @@ def parse_workspace_conversation(
         workspace: Task workspace directory
         start_time: ISO timestamp - find file modified after this time
         end_time: ISO timestamp - find file modified before this time
+        capture_messages: Store truncated message content on the metrics
 
     Returns:
         ConversationMetrics or None if no conversation found
@@ -335,7 +418,47 @@ def parse_workspace_conversation(
     if filepath is None:
         return None
 
-    return parse_conversation_file(filepath)
+    return parse_conversation_file(filepath, capture_messages=capture_messages)
+
+
+def _parse_one_workspace(
+    args: tuple[Path, str | None, str | None],
+) -> ConversationMetrics | None:
+    """Worker for parse_workspaces_bulk (must be module-level to pickle)."""
+    workspace, start_time, end_time = args
+    return parse_workspace_conversation(workspace, start_time, end_time)
+
+
+def parse_workspaces_bulk(
+    workspaces: list[tuple[Path, str | None, str | None]],
+) -> list[ConversationMetrics | None]:
+    """
+    Parse conversation metrics for many workspaces in parallel.
+
+    JSONL parsing is CPU-bound pure Python, and each workspace is
+    independent, so a process pool gives near-linear speedup when
+    reanalyzing a whole experiment.
+
+    Args:
+        workspaces: (workspace, start_time, end_time) tuples, as taken
+            by parse_workspace_conversation
+
+    Returns:
+        ConversationMetrics (or None) per workspace, in input order
+    """
+    if not workspaces:
+        return []
+    if len(workspaces) == 1:
+        return [_parse_one_workspace(workspaces[0])]
+
+    chunksize = max(1, len(workspaces) // (4 * (os.cpu_count() or 1)))
+    try:
+        with ProcessPoolExecutor() as pool:
+            return list(pool.map(_parse_one_workspace, workspaces, chunksize=chunksize))
+    except (OSError, RuntimeError):
+        # Process pools can be unavailable (restricted environments);
+        # fall back to the sequential path.
+        return [_parse_one_workspace(args) for args in workspaces]
 
 
 def calculate_time_delta_seconds(
@@ -352,11 +475,7 @@ def calculate_time_delta_seconds(
     Returns:
         Time difference in seconds
     """
-    from datetime import datetime
-
     try:
-        start = datetime.fromisoformat(start_iso.replace('Z', '+00:00'))
-        end = datetime.fromisoformat(end_iso.replace('Z', '+00:00'))
-        return (end - start).total_seconds()
+        return (_parse_iso(end_iso) - _parse_iso(start_iso)).total_seconds()
     except (ValueError, TypeError):
         return 0.0
@@ -24,7 +24,7 @@ from rich.text import Text
 from harness.models import ExperimentGroup, Task, TaskResult, TaskStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskProgress:
     """Tracks progress for a single task across groups."""
 
@@ -33,42 +33,49 @@ class TaskProgress:
     treatment_result: TaskResult | None = None
     control_status: str = "pending"  # pending, running, completed, failed
     treatment_status: str = "pending"
-
-    def get_control_display(self) -> str:
-        """Get display string for control group."""
-        if self.control_status == "pending":
+    # Rendered markup strings, invalidated by __setattr__ when the
+    # corresponding status/result changes so redraws of unchanged rows
+    # skip the formatting entirely.
+    _control_cache: str | None = field(default=None, repr=False)
+    _treatment_cache: str | None = field(default=None, repr=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("control_status", "control_result"):
+            object.__setattr__(self, "_control_cache", None)
+        elif name in ("treatment_status", "treatment_result"):
+            object.__setattr__(self, "_treatment_cache", None)
+        object.__setattr__(self, name, value)
+
+    @staticmethod
+    def _render(status: str, result: TaskResult | None) -> str:
+        """Render the markup string for one group's cell."""
+        if status == "pending":
             return "[dim]○ pending[/dim]"
-        elif self.control_status == "running":
+        elif status == "running":
             return "[yellow]⏳ running...[/yellow]"
-        elif self.control_result:
-            rate = self.control_result.metrics.test_pass_rate
-            tokens = self.control_result.metrics.total_tokens
-            if self.control_result.status == TaskStatus.COMPLETED:
+        elif result:
+            rate = result.metrics.test_pass_rate
+            tokens = result.metrics.total_tokens
+            if result.status == TaskStatus.COMPLETED:
                 color = "green" if rate == 1.0 else "yellow" if rate > 0 else "red"
                 return f"[{color}]✓ {rate:.0%}[/{color}] [dim]({tokens}t)[/dim]"
-            elif self.control_result.status == TaskStatus.FAILED:
+            elif result.status == TaskStatus.FAILED:
                 return "[red]✗ failed[/red]"
-            elif self.control_result.status == TaskStatus.TIMEOUT:
+            elif result.status == TaskStatus.TIMEOUT:
                 return "[red]⏱ timeout[/red]"
         return "[dim]○[/dim]"
 
+    def get_control_display(self) -> str:
+        """Get display string for control group."""
+        if self._control_cache is None:
+            self._control_cache = self._render(self.control_status, self.control_result)
+        return self._control_cache
+
     def get_treatment_display(self) -> str:
         """Get display string for treatment group."""
-        if self.treatment_status == "pending":
-            return "[dim]○ pending[/dim]"
-        elif self.treatment_status == "running":
-            return "[yellow]⏳ running...[/yellow]"
-        elif self.treatment_result:
-            rate = self.treatment_result.metrics.test_pass_rate
-            tokens = self.treatment_result.metrics.total_tokens
-            if self.treatment_result.status == TaskStatus.COMPLETED:
-                color = "green" if rate == 1.0 else "yellow" if rate > 0 else "red"
-                return f"[{color}]✓ {rate:.0%}[/{color}] [dim]({tokens}t)[/dim]"
-            elif self.treatment_result.status == TaskStatus.FAILED:
-                return "[red]✗ failed[/red]"
-            elif self.treatment_result.status == TaskStatus.TIMEOUT:
-                return "[red]⏱ timeout[/red]"
-        return "[dim]○[/dim]"
+        if self._treatment_cache is None:
+            self._treatment_cache = self._render(self.treatment_status, self.treatment_result)
+        return self._treatment_cache
 
 
 @dataclass
@@ -82,11 +89,29 @@ class BenchmarkProgress:
     start_time: datetime = field(default_factory=datetime.now)
     completed_count: int = 0
     total_count: int = 0
+    # Running per-group aggregates, maintained by mark_completed so
+    # get_group_stats stays O(1) instead of rescanning every task on
+    # each redraw.
+    _control_agg: dict[str, float] = field(
+        default_factory=lambda: {"completed": 0, "pass_sum": 0.0, "tok_sum": 0}
+    )
+    _treatment_agg: dict[str, float] = field(
+        default_factory=lambda: {"completed": 0, "pass_sum": 0.0, "tok_sum": 0}
+    )
+    # Progress entries in task order plus an id -> index map; the
+    # redraw path walks the list in lockstep with tasks instead of a
+    # dict lookup per row.  task_progress shares the same objects for
+    # keyed access.
+    _progress_list: list[TaskProgress] = field(default_factory=list)
+    _task_idx: dict[str, int] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Initialize task progress tracking."""
-        for task in self.tasks:
-            self.task_progress[task.id] = TaskProgress(task=task)
+        self._progress_list = [TaskProgress(task=task) for task in self.tasks]
+        self._task_idx = {task.id: i for i, task in enumerate(self.tasks)}
+        self.task_progress = dict(
+            zip(self._task_idx, self._progress_list)
+        )
         # Total = tasks * 2 (control + treatment)
         self.total_count = len(self.tasks) * 2
 
@@ -113,35 +138,29 @@ class BenchmarkProgress:
                 self.task_progress[task_id].treatment_status = "completed"
                 self.task_progress[task_id].treatment_result = result
 
+        if result.status == TaskStatus.COMPLETED:
+            agg = (
+                self._control_agg
+                if group == ExperimentGroup.CONTROL
+                else self._treatment_agg
+            )
+            agg["completed"] += 1
+            agg["pass_sum"] += result.metrics.test_pass_rate
+            agg["tok_sum"] += result.metrics.total_tokens
+
     def get_group_stats(self, group: ExperimentGroup) -> dict[str, Any]:
-        """Get statistics for a group."""
-        results = []
-        for tp in self.task_progress.values():
-            if group == ExperimentGroup.CONTROL and tp.control_result:
-                results.append(tp.control_result)
-            elif group == ExperimentGroup.TREATMENT and tp.treatment_result:
-                results.append(tp.treatment_result)
-
-        if not results:
-            return {"completed": 0, "total": len(self.tasks), "pass_rate": 0, "tokens": 0}
-
-        completed = [r for r in results if r.status == TaskStatus.COMPLETED]
-        avg_pass = (
-            sum(r.metrics.test_pass_rate for r in completed) / len(completed)
-            if completed
-            else 0
+        """Get statistics for a group from the running aggregates."""
+        agg = (
+            self._control_agg
+            if group == ExperimentGroup.CONTROL
+            else self._treatment_agg
         )
-        avg_tokens = (
-            sum(r.metrics.total_tokens for r in completed) / len(completed)
-            if completed
-            else 0
-        )
-
+        completed = int(agg["completed"])
         return {
-            "completed": len(completed),
+            "completed": completed,
             "total": len(self.tasks),
-            "pass_rate": avg_pass,
-            "tokens": avg_tokens,
+            "pass_rate": agg["pass_sum"] / completed if completed else 0,
+            "tokens": agg["tok_sum"] / completed if completed else 0,
         }
 
 
@@ -171,6 +190,11 @@ class ProgressDisplay:
         )
         self.main_task: TaskID | None = None
 
+        # The renderable is only rebuilt when progress state actually
+        # changes; Live's auto-refresh repaints the cached Group.
+        self._dirty = True
+        self._cached_display: Group | None = None
+
     def _build_header_panel(self) -> Panel:
         """Build the header panel with progress bar."""
         current = self.progress_data.current_task
@@ -209,19 +233,19 @@ class ProgressDisplay:
         table.add_column("Treatment", justify="center")
         table.add_column("Tier", justify="center", style="dim")
 
-        # Categorize tasks by status
+        # Categorize tasks by status, walking the index-ordered
+        # progress list alongside tasks
         running = []
         completed = []
         pending = []
 
-        for task in self.progress_data.tasks:
-            tp = self.progress_data.task_progress[task.id]
+        for task, tp in zip(self.progress_data.tasks, self.progress_data._progress_list):
             if tp.control_status == "running" or tp.treatment_status == "running":
-                running.append(task)
+                running.append((task, tp))
             elif tp.control_status == "completed" or tp.treatment_status == "completed":
-                completed.append(task)
+                completed.append((task, tp))
             else:
-                pending.append(task)
+                pending.append((task, tp))
 
         # Build display list: running first, then recent completed, then pending
         display_tasks = []
@@ -240,8 +264,7 @@ class ProgressDisplay:
         # Track if we're hiding tasks
         hidden_count = len(self.progress_data.tasks) - len(display_tasks)
 
-        for task in display_tasks:
-            tp = self.progress_data.task_progress[task.id]
+        for task, tp in display_tasks:
             tier = task.tier.value.split("_")[0]  # tier1 or tier2
 
             # Highlight current task
@@ -300,12 +323,16 @@ class ProgressDisplay:
         )
 
     def _build_display(self) -> Group:
-        """Build the complete display."""
-        return Group(
-            self._build_header_panel(),
-            self._build_task_table(),
-            self._build_summary_panel(),
-        )
+        """Build the complete display, reusing the cached renderable
+        when nothing has changed since the last build."""
+        if self._dirty or self._cached_display is None:
+            self._cached_display = Group(
+                self._build_header_panel(),
+                self._build_task_table(),
+                self._build_summary_panel(),
+            )
+            self._dirty = False
+        return self._cached_display
 
     def start(self) -> None:
         """Start the live display."""
@@ -316,7 +343,7 @@ class ProgressDisplay:
         self.live = Live(
             self._build_display(),
             console=self.console,
-            refresh_per_second=4,
+            refresh_per_second=2,
             transient=False,
         )
         self.live.start()
@@ -338,6 +365,7 @@ class ProgressDisplay:
     def mark_task_running(self, task_id: str, group: ExperimentGroup) -> None:
         """Mark a task as running and update display."""
         self.progress_data.mark_running(task_id, group)
+        self._dirty = True
         self.update()
 
     def mark_task_completed(
@@ -345,6 +373,7 @@ class ProgressDisplay:
     ) -> None:
         """Mark a task as completed and update display."""
         self.progress_data.mark_completed(task_id, group, result)
+        self._dirty = True
         self.update()
 
     def __enter__(self) -> "ProgressDisplay":
@@ -4,15 +4,40 @@ Docker-based SWE-bench evaluation runner.
 Uses swebench's Docker harness for reproducible, isolated test execution.
 """
 
+import functools
+import hashlib
 import json
 import subprocess
-import tempfile
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
 from harness.models import Task, SWEMetadata
 
+try:
+    import docker as _docker_sdk
+except ImportError:  # optional; falls back to the docker CLI
+    _docker_sdk = None
+
+try:
+    import pygit2
+except ImportError:  # optional; falls back to git subprocesses
+    pygit2 = None
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+# One SDK client per process, reused across evaluations so each check
+# is a ping over an existing Unix-socket connection instead of a fork.
+_docker_client = None
+
+# Patches beyond this size are almost certainly runaway edits (vendored
+# trees, generated files); reject them before burning Docker CPU.
+_MAX_PATCH_BYTES = 2 << 20  # 2 MiB
+
 
 @dataclass
 class DockerEvalResult:
@@ -25,13 +50,44 @@ class DockerEvalResult:
     error_message: str = ""
 
 
+# Daemon availability rarely changes mid-run; cache the answer with a
+# short TTL so batched evaluations don't re-probe per task.
+_docker_check: tuple[float, bool, str] | None = None
+_DOCKER_CHECK_TTL = 60.0
+
+
 def check_docker_available() -> tuple[bool, str]:
     """
     Check if Docker is available and running.
 
+    The result is cached for a minute; repeated calls within a run are
+    a tuple read instead of a daemon round-trip.
+
     Returns:
         Tuple of (available, message)
     """
+    global _docker_check
+    now = time.monotonic()
+    if _docker_check is not None and now - _docker_check[0] < _DOCKER_CHECK_TTL:
+        return _docker_check[1], _docker_check[2]
+    ok, msg = _check_docker_available_uncached()
+    _docker_check = (now, ok, msg)
+    return ok, msg
+
+
+def _check_docker_available_uncached() -> tuple[bool, str]:
+    """Probe the Docker daemon (SDK ping or 'docker info' fallback)."""
+    global _docker_client
+    if _docker_sdk is not None:
+        try:
+            if _docker_client is None:
+                _docker_client = _docker_sdk.from_env()
+            _docker_client.ping()
+            return True, "Docker is available"
+        except Exception as e:
+            _docker_client = None
+            return False, f"Docker not running: {e}"
+
     try:
         result = subprocess.run(
             ["docker", "info"],
@@ -48,10 +104,15 @@ def check_docker_available() -> tuple[bool, str]:
         return False, "Docker check timed out"
 
 
+@functools.cache
 def check_swebench_available() -> tuple[bool, str]:
     """
     Check if swebench package is installed.
 
+    Cached for the process lifetime — installation status cannot
+    change under a running benchmark, so later calls skip the import
+    machinery entirely.
+
     Returns:
         Tuple of (available, message)
     """
@@ -78,22 +139,45 @@ def extract_patch_from_workspace(workspace: Path, base_commit: str = "") -> str:
     if not repo_dir.exists():
         return ""
 
+    # In-process diff via libgit2 where available: no fork, no pipe,
+    # and no full-stdout decode of a subprocess
+    if pygit2 is not None:
+        try:
+            repo = pygit2.Repository(str(repo_dir))
+            diff = repo.diff(base_commit) if base_commit else repo.diff()
+            patch = diff.patch or ""
+            if len(patch) > _MAX_PATCH_BYTES:
+                return ""
+            return patch
+        except Exception:
+            pass  # fall through to the git subprocess
+
     try:
-        # Get diff of all changes
+        # Get diff of all changes.  Stream stdout in byte chunks so a
+        # pathological diff (large repos can produce many MB) is
+        # rejected early instead of buffered and decoded wholesale.
         cmd = ["git", "diff"]
         if base_commit:
             cmd.append(base_commit)
 
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
             cwd=repo_dir,
-            capture_output=True,
-            text=True,
-            timeout=30,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
-
-        if result.returncode == 0:
-            return result.stdout
+        chunks = []
+        total = 0
+        while chunk := proc.stdout.read(65536):
+            total += len(chunk)
+            if total > _MAX_PATCH_BYTES:
+                proc.kill()
+                proc.wait()
+                return ""
+            chunks.append(chunk)
+
+        if proc.wait(timeout=30) == 0:
+            return b"".join(chunks).decode("utf-8", "replace")
 
         return ""
     except Exception:
@@ -101,36 +185,45 @@ def extract_patch_from_workspace(workspace: Path, base_commit: str = "") -> str:
 
 
 def create_predictions_file(
-    instance_id: str,
-    model_patch: str,
+    predictions: list[tuple[str, str]],
     model_name: str = "invar-benchmark",
+    run_id: str = "invar-eval",
     output_path: Path | None = None,
 ) -> Path:
     """
     Create a predictions JSONL file for swebench evaluation.
 
+    The file lives under logs/ next to the swebench output rather than
+    in a throwaway tempfile, so it survives as a run artifact and is
+    simply rewritten on re-runs.
+
     Args:
-        instance_id: SWE-bench instance ID (e.g., "astropy__astropy-14539")
-        model_patch: Unified diff patch string
+        predictions: (instance_id, model_patch) pairs to evaluate
         model_name: Model identifier
-        output_path: Optional output path (creates temp file if None)
+        run_id: Run identifier, used to name the default output path
+        output_path: Optional explicit output path
 
     Returns:
         Path to the predictions file
     """
-    prediction = {
-        "instance_id": instance_id,
-        "model_name_or_path": model_name,
-        "model_patch": model_patch,
-    }
-
     if output_path is None:
-        # Create temporary file
-        fd, path = tempfile.mkstemp(suffix=".jsonl", prefix="swe_pred_")
-        output_path = Path(path)
-
-    with open(output_path, "w") as f:
-        f.write(json.dumps(prediction) + "\n")
+        output_path = Path("logs") / "predictions" / f"{run_id}.jsonl"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    rows = (
+        {
+            "instance_id": instance_id,
+            "model_name_or_path": model_name,
+            "model_patch": model_patch,
+        }
+        for instance_id, model_patch in predictions
+    )
+    if orjson is not None:
+        lines = [orjson.dumps(row) for row in rows]
+    else:
+        lines = [json.dumps(row).encode() for row in rows]
+    # One write_bytes instead of a buffered line loop
+    output_path.write_bytes(b"\n".join(lines) + b"\n" if lines else b"")
 
     return output_path
 
@@ -166,6 +259,11 @@ def run_docker_evaluation(
 
     instance_id = task.swe_metadata.instance_id
 
+    # A finished evaluation leaves a report behind; reuse it instead
+    # of re-running the container
+    if _report_file(instance_id, run_id).exists():
+        return _parse_evaluation_results(instance_id, run_id)
+
     # Check prerequisites
     docker_ok, docker_msg = check_docker_available()
     if not docker_ok:
@@ -189,9 +287,9 @@ def run_docker_evaluation(
 
     # Create predictions file
     predictions_path = create_predictions_file(
-        instance_id=instance_id,
-        model_patch=model_patch,
+        [(instance_id, model_patch)],
         model_name="invar-benchmark",
+        run_id=run_id,
     )
 
     try:
@@ -227,10 +325,173 @@ def run_docker_evaluation(
             tests_failed=0,
             error_message=str(e),
         )
-    finally:
-        # Cleanup predictions file
-        if predictions_path.exists():
-            predictions_path.unlink()
+
+
+# Root of swebench's evaluation output tree; built once so every path
+# below is a couple of joins instead of a parse of the full string.
+_RUN_EVAL_DIR = Path("logs/run_evaluation")
+
+# Evaluation outcomes keyed by (instance, patch) content hash; a repeat
+# of the same patch skips minutes of container startup and test runs.
+_EVAL_CACHE_DIR = Path("logs/eval_cache")
+
+
+def _eval_cache_file(instance_id: str, model_patch: str) -> Path:
+    """Cache path for an evaluation of this exact patch on this instance."""
+    key = hashlib.sha256(f"{instance_id}:{model_patch}".encode()).hexdigest()
+    return _EVAL_CACHE_DIR / f"{key}.json"
+
+
+def _report_file(
+    instance_id: str,
+    run_id: str,
+    model_name: str = "invar-benchmark",
+) -> Path:
+    """Path of the per-instance report swebench writes for a run."""
+    return _RUN_EVAL_DIR / run_id / model_name / instance_id / "report.json"
+
+
+def _load_json(path: Path) -> Any:
+    """Load a JSON file, preferring orjson when available."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# results.json is written once per run but consulted for every instance
+# that misses the per-instance fallbacks; parse it once per run_id.
+_summary_cache: dict[str, dict] = {}
+
+
+def _load_run_summary(run_id: str) -> dict | None:
+    """Parsed results.json for a run, memoized per run_id.
+
+    Only successful parses are cached, so a summary written later in the
+    same process is still picked up.
+    """
+    cached = _summary_cache.get(run_id)
+    if cached is not None:
+        return cached
+    summary_file = _RUN_EVAL_DIR / run_id / "results.json"
+    if summary_file.is_file():
+        try:
+            summary = _load_json(summary_file)
+        except Exception:
+            return None
+        if isinstance(summary, dict):
+            _summary_cache[run_id] = summary
+            return summary
+    return None
+
+
+def run_docker_evaluation_batch(
+    tasks: list[Task],
+    patches: list[str],
+    timeout: int = 1800,
+    max_workers: int = 8,
+    run_id: str = "invar-eval",
+) -> list[DockerEvalResult]:
+    """
+    Evaluate many SWE task patches with a single swebench run.
+
+    One predictions file and one harness invocation let swebench
+    amortize dataset loading and image setup across instances while
+    running up to max_workers containers in parallel, instead of a
+    full harness startup per task.
+
+    Args:
+        tasks: Tasks with SWE metadata, parallel to patches
+        patches: Unified diff per task
+        timeout: Timeout per instance in seconds
+        max_workers: Number of parallel evaluation workers
+        run_id: Identifier for this evaluation run
+
+    Returns:
+        DockerEvalResult per task, in input order
+    """
+    results: list[DockerEvalResult | None] = [None] * len(tasks)
+    evaluable: list[tuple[int, str, str]] = []  # (index, instance_id, patch)
+
+    for i, (task, patch) in enumerate(zip(tasks, patches)):
+        if not task.swe_metadata:
+            results[i] = DockerEvalResult(
+                instance_id="",
+                resolved=False,
+                tests_passed=0,
+                tests_failed=0,
+                error_message="Task has no SWE metadata",
+            )
+        else:
+            evaluable.append((i, task.swe_metadata.instance_id, patch))
+
+    if not evaluable:
+        return [r for r in results if r is not None]
+
+    # Instances whose report already exists are cache hits from an
+    # earlier run: parse them directly and only evaluate the rest.
+    pending: list[tuple[int, str, str]] = []
+    for item in evaluable:
+        i, instance_id, _ = item
+        if _report_file(instance_id, run_id).exists():
+            results[i] = _parse_evaluation_results(instance_id, run_id)
+        else:
+            pending.append(item)
+
+    def _fail_pending(message: str) -> list[DockerEvalResult]:
+        for i, instance_id, _ in pending:
+            results[i] = DockerEvalResult(
+                instance_id=instance_id,
+                resolved=False,
+                tests_passed=0,
+                tests_failed=0,
+                error_message=message,
+            )
+        return [r for r in results if r is not None]
+
+    if pending:
+        # Check prerequisites once for the whole batch; a fully cached
+        # batch needs neither Docker nor swebench
+        docker_ok, docker_msg = check_docker_available()
+        if not docker_ok:
+            return _fail_pending(docker_msg)
+
+        swe_ok, swe_msg = check_swebench_available()
+        if not swe_ok:
+            return _fail_pending(swe_msg)
+
+        predictions_path = create_predictions_file(
+            [(instance_id, patch) for _, instance_id, patch in pending],
+            model_name="invar-benchmark",
+            run_id=run_id,
+        )
+
+        try:
+            from swebench.harness.run_evaluation import main as swebench_main
+
+            swebench_main(
+                dataset_name="princeton-nlp/SWE-bench_Lite",
+                split="test",
+                instance_ids=[instance_id for _, instance_id, _ in pending],
+                predictions_path=str(predictions_path),
+                max_workers=max_workers,
+                force_rebuild=False,
+                cache_level="env",
+                clean=False,
+                open_file_limit=4096,
+                run_id=run_id,
+                timeout=timeout,
+                namespace=None,  # Build locally on ARM Macs
+                rewrite_reports=False,
+                modal=False,
+            )
+        except Exception as e:
+            return _fail_pending(str(e))
+
+        for i, instance_id, _ in pending:
+            results[i] = _parse_evaluation_results(instance_id, run_id)
+
+    return [r for r in results if r is not None]
 
 
 def _parse_evaluation_results(
@@ -250,15 +511,12 @@ def _parse_evaluation_results(
         DockerEvalResult parsed from output
     """
     # swebench writes results to logs/run_evaluation/{run_id}/{model_name}/{instance_id}/
-    result_dir = Path(f"logs/run_evaluation/{run_id}/{model_name}/{instance_id}")
-
-    # Look for report file (swebench structure)
-    report_file = result_dir / "report.json"
+    run_dir = _RUN_EVAL_DIR / run_id
+    report_file = run_dir / model_name / instance_id / "report.json"
 
-    if report_file.exists():
+    if report_file.is_file():
         try:
-            with open(report_file) as f:
-                report = json.load(f)
+            report = _load_json(report_file)
 
             # Report is keyed by instance_id
             instance_report = report.get(instance_id, {})
@@ -287,12 +545,10 @@ def _parse_evaluation_results(
             pass
 
     # Fallback: check old-style result path
-    old_result_dir = Path(f"logs/run_evaluation/{run_id}")
-    old_report_file = old_result_dir / f"{instance_id}.json"
-    if old_report_file.exists():
+    old_report_file = run_dir / f"{instance_id}.json"
+    if old_report_file.is_file():
         try:
-            with open(old_report_file) as f:
-                report = json.load(f)
+            report = _load_json(old_report_file)
 
             return DockerEvalResult(
                 instance_id=instance_id,
@@ -303,22 +559,16 @@ def _parse_evaluation_results(
         except Exception:
             pass
 
-    # Fallback: check summary file
-    summary_file = old_result_dir / "results.json"
-    if summary_file.exists():
-        try:
-            with open(summary_file) as f:
-                summary = json.load(f)
-
-            resolved = instance_id in summary.get("resolved", [])
-            return DockerEvalResult(
-                instance_id=instance_id,
-                resolved=resolved,
-                tests_passed=1 if resolved else 0,
-                tests_failed=0 if resolved else 1,
-            )
-        except Exception:
-            pass
+    # Fallback: check summary file (parsed once per run_id)
+    summary = _load_run_summary(run_id)
+    if summary is not None:
+        resolved = instance_id in summary.get("resolved", [])
+        return DockerEvalResult(
+            instance_id=instance_id,
+            resolved=resolved,
+            tests_passed=1 if resolved else 0,
+            tests_failed=0 if resolved else 1,
+        )
 
     return DockerEvalResult(
         instance_id=instance_id,
@@ -333,6 +583,7 @@ def run_swe_task_with_docker(
     task: Task,
     workspace: Path,
     timeout: int = 1800,
+    max_workers: int = 8,
 ) -> dict[str, Any]:
     """
     High-level function to evaluate a SWE task using Docker.
@@ -343,6 +594,7 @@ def run_swe_task_with_docker(
         task: Task with SWE metadata
         workspace: Workspace where Claude made changes
         timeout: Evaluation timeout
+        max_workers: Parallel workers for the swebench harness
 
     Returns:
         Dictionary with evaluation results for metrics collection
@@ -366,12 +618,35 @@ def run_swe_task_with_docker(
             "error": "No changes detected in workspace",
         }
 
-    # Run Docker evaluation
-    result = run_docker_evaluation(
-        task=task,
-        model_patch=model_patch,
-        timeout=timeout,
-    )
+    # Same patch already evaluated this run? Skip the containers.
+    cache_file = _eval_cache_file(task.swe_metadata.instance_id, model_patch)
+    result = None
+    if cache_file.is_file():
+        try:
+            result = DockerEvalResult(**_load_json(cache_file))
+        except Exception:
+            result = None
+
+    if result is None:
+        # Run Docker evaluation
+        result = run_docker_evaluation(
+            task=task,
+            model_patch=model_patch,
+            timeout=timeout,
+            max_workers=max_workers,
+        )
+        # Persist clean outcomes only; errors (daemon down, timeout)
+        # should be retried, not replayed from cache.
+        if not result.error_message:
+            try:
+                _EVAL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                payload = asdict(result)
+                if orjson is not None:
+                    cache_file.write_bytes(orjson.dumps(payload))
+                else:
+                    cache_file.write_text(json.dumps(payload))
+            except OSError:
+                pass
 
     return {
         "docker_eval": True,
@@ -4,35 +4,50 @@ LLM-based semantic detection for interactive mode automation.
 Uses OpenAI API to determine if the agent is waiting for user input.
 """
 
+import asyncio
+import functools
 import json
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
-# Load .env file if present
-_env_loaded = False
-
 
+@functools.cache
 def _load_env():
-    """Load environment variables from .env file."""
-    global _env_loaded
-    if _env_loaded:
-        return
-    _env_loaded = True
-
+    """Load environment variables from .env file (once per process)."""
     # Find .env in project root
     env_path = Path(__file__).parent.parent / ".env"
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+        for line in env_path.read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                os.environ.setdefault(key.strip(), value.strip())
 
 
 # Lazy import to avoid dependency if not used
 _openai_client: Optional[object] = None
+_async_openai_client: Optional[object] = None
+
+
+def _http_client(async_: bool):
+    """Pooled httpx client with HTTP/2 so concurrent detections
+    multiplex on a few sockets instead of one connection each.
+
+    Returns None (letting openai build its default client) when httpx
+    or its h2 extra is unavailable.
+    """
+    try:
+        import httpx
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        if async_:
+            return httpx.AsyncClient(http2=True, limits=limits)
+        return httpx.Client(http2=True, limits=limits)
+    except Exception:
+        return None
 
 
 def _get_client():
@@ -45,12 +60,30 @@ def _get_client():
             api_key = os.environ.get("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY environment variable not set")
-            _openai_client = OpenAI(api_key=api_key)
+            _openai_client = OpenAI(api_key=api_key, http_client=_http_client(async_=False))
         except ImportError:
             raise ImportError("openai package not installed. Run: pip install openai")
     return _openai_client
 
 
+def _get_async_client():
+    """Get or create async OpenAI client."""
+    global _async_openai_client
+    if _async_openai_client is None:
+        _load_env()
+        try:
+            from openai import AsyncOpenAI
+            api_key = os.environ.get("OPENAI_API_KEY")
+            if not api_key:
+                raise ValueError("OPENAI_API_KEY environment variable not set")
+            _async_openai_client = AsyncOpenAI(
+                api_key=api_key, http_client=_http_client(async_=True)
+            )
+        except ImportError:
+            raise ImportError("openai package not installed. Run: pip install openai")
+    return _async_openai_client
+
+
 SYSTEM_PROMPT = """You analyze CLI output from an AI coding assistant to determine if it's waiting for user input.
 
 Respond ONLY with a JSON object (no markdown, no explanation):
@@ -72,6 +105,74 @@ NOT WAITING signals (respond with empty string):
 For most waiting cases, respond with "continue" to let the agent proceed autonomously."""
 
 
+# Cheap pre-filter: output without a question mark or waiting-style phrasing
+# is never a prompt for input, so we can skip the API call entirely.
+_WAITING_HINT_RE = re.compile(
+    r"\?|should i|what would|what's next|next step|how should|proceed"
+    r"|continue|confirm|waiting for|your input|let me know",
+    re.IGNORECASE,
+)
+
+# Deterministic verdicts for the unambiguous cases the SYSTEM_PROMPT
+# enumerates: active tool execution means not waiting, a trailing
+# question or explicit prompt means waiting. Only output matching
+# neither pays for the API round-trip.
+_NOT_WAITING_RE = re.compile(r"\b(Reading|Writing|Editing|Running|Thinking)\b|⏺")
+_WAITING_RE = re.compile(
+    r"\?\s*$|\b(continue\?|proceed\?|Next step|What would you like|Should I)",
+)
+
+
+def _prefilter(truncated: str) -> tuple[bool, str] | None:
+    """Resolve the unambiguous cases without an API call.
+
+    Returns a verdict tuple, or None when the output is ambiguous and
+    needs the LLM.
+    """
+    if _NOT_WAITING_RE.search(truncated):
+        return False, ""
+    if _WAITING_RE.search(truncated):
+        return True, "continue"
+    if not _WAITING_HINT_RE.search(truncated):
+        return False, ""
+    return None
+
+
+def _request_params(truncated: str, model: str) -> dict:
+    """Build chat completion arguments shared by sync and async paths."""
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": f"Recent CLI output:\n\n{truncated}"},
+        ],
+        # Guaranteed-JSON output removes the need for markdown stripping
+        "response_format": {"type": "json_object"},
+        "max_tokens": 100,
+        "temperature": 0,
+    }
+
+
+def _parse_detection_content(content: str) -> tuple[bool, str]:
+    """Parse the model's JSON verdict into (is_waiting, suggested_response)."""
+    result = json.loads(content.strip())
+    is_waiting = result.get("waiting", False)
+    suggested = result.get("response", "continue" if is_waiting else "")
+    return is_waiting, suggested
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_waiting_cached(truncated: str, model: str) -> tuple[bool, str]:
+    """Query the API for a verdict; identical output tails hit the cache.
+
+    Errors propagate (and are therefore not cached) so transient API
+    failures don't pin a stale (False, "") result for a given tail.
+    """
+    client = _get_client()
+    response = client.chat.completions.create(**_request_params(truncated, model))
+    return _parse_detection_content(response.choices[0].message.content)
+
+
 def detect_waiting_state(recent_output: str, model: str = "gpt-4o-mini") -> tuple[bool, str]:
     """
     Use LLM to determine if agent is waiting for user input.
@@ -86,43 +187,95 @@ def detect_waiting_state(recent_output: str, model: str = "gpt-4o-mini") -> tupl
     if not recent_output.strip():
         return False, ""
 
+    # Truncate to last 1500 chars to manage token usage
+    truncated = recent_output[-1500:] if len(recent_output) > 1500 else recent_output
+
+    verdict = _prefilter(truncated)
+    if verdict is not None:
+        return verdict
+
     try:
-        client = _get_client()
+        return _detect_waiting_cached(truncated, model)
+    except Exception as e:
+        # On any error, fall back to not waiting (safe default)
+        print(f"[LLM Detector] Error: {e}")
+        return False, ""
 
-        # Truncate to last 1500 chars to manage token usage
-        truncated = recent_output[-1500:] if len(recent_output) > 1500 else recent_output
 
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": f"Recent CLI output:\n\n{truncated}"}
-            ],
-            max_tokens=100,
-            temperature=0,
-        )
+async def detect_waiting_state_async(
+    recent_output: str, model: str = "gpt-4o-mini"
+) -> tuple[bool, str]:
+    """
+    Async variant of detect_waiting_state using openai.AsyncOpenAI.
 
-        content = response.choices[0].message.content.strip()
+    Lets callers poll multiple sessions without blocking on each other.
 
-        # Parse JSON response
-        # Handle potential markdown wrapping
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
+    Returns:
+        (is_waiting, suggested_response)
+    """
+    if not recent_output.strip():
+        return False, ""
 
-        result = json.loads(content)
-        is_waiting = result.get("waiting", False)
-        suggested = result.get("response", "continue" if is_waiting else "")
+    truncated = recent_output[-1500:] if len(recent_output) > 1500 else recent_output
 
-        return is_waiting, suggested
+    verdict = _prefilter(truncated)
+    if verdict is not None:
+        return verdict
 
+    try:
+        client = _get_async_client()
+        response = await client.chat.completions.create(**_request_params(truncated, model))
+        return _parse_detection_content(response.choices[0].message.content)
     except Exception as e:
-        # On any error, fall back to not waiting (safe default)
         print(f"[LLM Detector] Error: {e}")
         return False, ""
 
 
+def detect_waiting_states(
+    outputs: list[str], model: str = "gpt-4o-mini"
+) -> list[tuple[bool, str]]:
+    """
+    Classify many session tails in one call, overlapping API latency.
+
+    The regex pre-filter and verdict cache resolve most entries without
+    a request; whatever remains is sent concurrently over the async
+    client instead of serializing one ~500ms round-trip per session.
+
+    Returns:
+        One (is_waiting, suggested_response) per input, in order.
+    """
+    if not outputs:
+        return []
+    if len(outputs) == 1:
+        return [detect_waiting_state(outputs[0], model)]
+
+    async def _gather() -> list[tuple[bool, str]]:
+        global _async_openai_client
+        try:
+            return list(await asyncio.gather(
+                *(detect_waiting_state_async(out, model) for out in outputs)
+            ))
+        finally:
+            # The async client binds its connection pool to the running
+            # loop, which asyncio.run is about to close; a client kept
+            # across batches would raise "Event loop is closed" on every
+            # later call. Close it here and let the next batch build a
+            # fresh one.
+            client = _async_openai_client
+            _async_openai_client = None
+            if client is not None:
+                try:
+                    await client.close()
+                except Exception:
+                    pass
+
+    try:
+        return asyncio.run(_gather())
+    except RuntimeError:
+        # Already inside an event loop; fall back to sequential sync calls
+        return [detect_waiting_state(out, model) for out in outputs]
+
+
 def is_llm_detection_available() -> bool:
     """Check if LLM detection is available (API key set)."""
     _load_env()
@@ -2,7 +2,7 @@
 Data models for benchmark framework.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -31,7 +31,7 @@ class TaskStatus(Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+@dataclass(slots=True)
 class SWEMetadata:
     """SWE-bench specific metadata."""
     instance_id: str = ""
@@ -60,33 +60,15 @@ class SWEMetadata:
         return int(patch_lines + fail_count * 5 + pass_count * 0.1)
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "instance_id": self.instance_id,
-            "repo": self.repo,
-            "base_commit": self.base_commit,
-            "test_patch": self.test_patch,
-            "gold_patch": self.gold_patch,
-            "fail_to_pass": self.fail_to_pass,
-            "pass_to_pass": self.pass_to_pass,
-            "version": self.version,
-            "environment_setup_commit": self.environment_setup_commit,
-            "difficulty_score": self.difficulty_score or self.calculated_difficulty_score,
-        }
+        d = {f.name: getattr(self, f.name) for f in fields(self)}
+        d["difficulty_score"] = self.difficulty_score or self.calculated_difficulty_score
+        return d
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SWEMetadata":
-        metadata = cls(
-            instance_id=data.get("instance_id", ""),
-            repo=data.get("repo", ""),
-            base_commit=data.get("base_commit", ""),
-            test_patch=data.get("test_patch", ""),
-            gold_patch=data.get("gold_patch", ""),
-            fail_to_pass=data.get("fail_to_pass", []),
-            pass_to_pass=data.get("pass_to_pass", []),
-            version=data.get("version", ""),
-            environment_setup_commit=data.get("environment_setup_commit", ""),
-            difficulty_score=data.get("difficulty_score", 0),
-        )
+        # Known fields only; unknown keys are ignored, missing keys
+        # fall back to field defaults
+        metadata = cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
         # Auto-calculate if not stored
         if not metadata.difficulty_score:
             metadata.difficulty_score = metadata.calculated_difficulty_score
@@ -133,18 +115,11 @@ class Task:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         result = {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "tier": self.tier.value,
-            "prompt": self.prompt,
-            "initial_files": self.initial_files,
-            "test_file": self.test_file,
-            "hidden_test_file": self.hidden_test_file,
-            "expected_files": self.expected_files,
-            "tags": self.tags,
-            "difficulty": self.difficulty,
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name != "swe_metadata"
         }
+        result["tier"] = self.tier.value
         if self.swe_metadata:
             result["swe_metadata"] = self.swe_metadata.to_dict()
         return result
@@ -172,7 +147,7 @@ class Task:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskMetrics:
     """Metrics collected during task execution."""
     # Execution metrics
@@ -259,7 +234,7 @@ class ConversationMessage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result of a single task execution."""
     task_id: str
@@ -296,38 +271,9 @@ class TaskResult:
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "generated_files": self.generated_files,
-            "metrics": {
-                "iterations": self.metrics.iterations,
-                "total_tokens": self.metrics.total_tokens,
-                "input_tokens": self.metrics.input_tokens,
-                "output_tokens": self.metrics.output_tokens,
-                "execution_time_seconds": self.metrics.execution_time_seconds,
-                "cache_creation_tokens": self.metrics.cache_creation_tokens,
-                "cache_read_tokens": self.metrics.cache_read_tokens,
-                "tests_passed": self.metrics.tests_passed,
-                "tests_failed": self.metrics.tests_failed,
-                "tests_total": self.metrics.tests_total,
-                "hidden_tests_passed": self.metrics.hidden_tests_passed,
-                "hidden_tests_total": self.metrics.hidden_tests_total,
-                "guard_errors": self.metrics.guard_errors,
-                "guard_warnings": self.metrics.guard_warnings,
-                "contract_coverage": self.metrics.contract_coverage,
-                "has_contracts": self.metrics.has_contracts,
-                "lines_of_code": self.metrics.lines_of_code,
-                "cyclomatic_complexity": self.metrics.cyclomatic_complexity,
-                # Tool usage from Claude JSONL logs
-                "total_tool_calls": self.metrics.total_tool_calls,
-                "mcp_calls": self.metrics.mcp_calls,
-                "skill_calls": self.metrics.skill_calls,
-                "tool_breakdown": self.metrics.tool_breakdown,
-                # Invar protocol adherence
-                "has_checkin": self.metrics.has_checkin,
-                "has_final": self.metrics.has_final,
-                "final_status": self.metrics.final_status,
-                # Conversation stats
-                "assistant_messages": self.metrics.assistant_messages,
-                "user_messages": self.metrics.user_messages,
-            },
+            # All TaskMetrics fields are plain values, so asdict covers
+            # them without the hand-written list drifting from the class
+            "metrics": asdict(self.metrics),
             # Structured conversation data
             "conversation": {
                 "messages": [m.to_dict() for m in self.conversation_messages],
@@ -379,61 +325,63 @@ class ExperimentResult:
             if not results:
                 return {}
 
-            completed = [r for r in results if r.status == TaskStatus.COMPLETED]
+            # Aggregate in a single pass with running sums rather than
+            # one comprehension per statistic (each of which walked the
+            # whole list and recomputed the pass-rate properties)
+            completed_s = TaskStatus.COMPLETED
+            failed_s = TaskStatus.FAILED
+            timeout_s = TaskStatus.TIMEOUT
+            n_completed = n_failed = n_timeout = 0
+            n_checkin = n_final = n_final_pass = 0
+            sum_pass = sum_hidden = sum_iter = sum_tok = 0.0
+            sum_time = sum_mcp = sum_skill = sum_tool = 0.0
+
+            for r in results:
+                status = r.status
+                if status == completed_s:
+                    m = r.metrics
+                    n_completed += 1
+                    sum_pass += m.test_pass_rate
+                    sum_hidden += m.hidden_test_pass_rate
+                    sum_iter += m.iterations
+                    sum_tok += m.total_tokens
+                    sum_time += m.execution_time_seconds
+                    sum_mcp += m.mcp_calls
+                    sum_skill += m.skill_calls
+                    sum_tool += m.total_tool_calls
+                    if m.has_checkin:
+                        n_checkin += 1
+                    if m.has_final:
+                        n_final += 1
+                    if m.final_status == "PASS":
+                        n_final_pass += 1
+                elif status == failed_s:
+                    n_failed += 1
+                elif status == timeout_s:
+                    n_timeout += 1
+
+            # Sums are all zero when nothing completed, so dividing by
+            # one keeps the averages at 0.0
+            n = n_completed or 1
             return {
                 "total_tasks": len(results),
-                "completed": len(completed),
-                "failed": len([r for r in results if r.status == TaskStatus.FAILED]),
-                "timeout": len([r for r in results if r.status == TaskStatus.TIMEOUT]),
-                "avg_test_pass_rate": (
-                    sum(r.metrics.test_pass_rate for r in completed) / len(completed)
-                    if completed else 0.0
-                ),
-                "avg_hidden_test_pass_rate": (
-                    sum(r.metrics.hidden_test_pass_rate for r in completed) / len(completed)
-                    if completed else 0.0
-                ),
-                "avg_iterations": (
-                    sum(r.metrics.iterations for r in completed) / len(completed)
-                    if completed else 0.0
-                ),
-                "avg_tokens": (
-                    sum(r.metrics.total_tokens for r in completed) / len(completed)
-                    if completed else 0.0
-                ),
+                "completed": n_completed,
+                "failed": n_failed,
+                "timeout": n_timeout,
+                "avg_test_pass_rate": sum_pass / n,
+                "avg_hidden_test_pass_rate": sum_hidden / n,
+                "avg_iterations": sum_iter / n,
+                "avg_tokens": sum_tok / n,
                 # New metrics: time, MCP, Skills
-                "avg_execution_time": (
-                    sum(r.metrics.execution_time_seconds for r in completed) / len(completed)
-                    if completed else 0.0
-                ),
-                "total_execution_time": (
-                    sum(r.metrics.execution_time_seconds for r in completed)
-                ),
-                "avg_mcp_calls": (
-                    sum(r.metrics.mcp_calls for r in completed) / len(completed)
-                    if completed else 0.0
-                ),
-                "avg_skill_calls": (
-                    sum(r.metrics.skill_calls for r in completed) / len(completed)
-                    if completed else 0.0
-                ),
-                "avg_tool_calls": (
-                    sum(r.metrics.total_tool_calls for r in completed) / len(completed)
-                    if completed else 0.0
-                ),
+                "avg_execution_time": sum_time / n,
+                "total_execution_time": sum_time,
+                "avg_mcp_calls": sum_mcp / n,
+                "avg_skill_calls": sum_skill / n,
+                "avg_tool_calls": sum_tool / n,
                 # Invar protocol adherence
-                "checkin_rate": (
-                    sum(1 for r in completed if r.metrics.has_checkin) / len(completed)
-                    if completed else 0.0
-                ),
-                "final_rate": (
-                    sum(1 for r in completed if r.metrics.has_final) / len(completed)
-                    if completed else 0.0
-                ),
-                "final_pass_rate": (
-                    sum(1 for r in completed if r.metrics.final_status == "PASS") / len(completed)
-                    if completed else 0.0
-                ),
+                "checkin_rate": n_checkin / n,
+                "final_rate": n_final / n,
+                "final_pass_rate": n_final_pass / n,
             }
 
         return {
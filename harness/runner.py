@@ -14,11 +14,17 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional fast JSON serializer
+    orjson = None
+
 from harness.config import (
     BenchmarkConfig,
     create_experiment_metadata,
     setup_workspace,
     setup_swe_workspace,
+    shared_deps_env,
     get_cache_stats,
     clear_cache,
 )
@@ -292,6 +298,7 @@ class BenchmarkRunner:
                 process = subprocess.run(
                     cmd,
                     cwd=workspace,
+                    env=shared_deps_env(workspace),
                     capture_output=True,
                     text=True,
                     timeout=self.config.timeout_seconds,
@@ -316,6 +323,7 @@ class BenchmarkRunner:
                 repo_dir=repo_dir if is_swe_task else None,
                 use_docker=self.config.use_docker,
                 docker_timeout=self.config.docker_timeout,
+                docker_max_workers=self.config.docker_max_workers,
             )
 
             # Merge collected metrics with pre-parsed metrics
@@ -422,7 +430,7 @@ class BenchmarkRunner:
 
         # Use TERM=dumb to disable alternate screen buffer
         # This ensures PTY output is captured even when Claude hits max turns
-        env = os.environ.copy()
+        env = shared_deps_env(workspace) or os.environ.copy()
         env["TERM"] = "dumb"
 
         process = subprocess.Popen(
@@ -695,7 +703,11 @@ class BenchmarkRunner:
             start_time = result.start_time.isoformat() if result.start_time else None
             end_time = result.end_time.isoformat() if result.end_time else None
 
-            conv_metrics = parse_workspace_conversation(workspace, start_time, end_time)
+            # The runner preserves conversation transcripts in results,
+            # so it opts in to message capture
+            conv_metrics = parse_workspace_conversation(
+                workspace, start_time, end_time, capture_messages=True
+            )
             if conv_metrics is None:
                 return
 
@@ -860,6 +872,15 @@ class BenchmarkRunner:
                 status_icon = "✓" if result.status == TaskStatus.COMPLETED else "✗"
                 print(f"  {status_icon} {result.status.value}")
 
+    @staticmethod
+    def _dump_json(path: Path, obj: dict) -> None:
+        """Serialize obj to path, via orjson when available (3-5x faster)."""
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w") as f:
+                json.dump(obj, f, indent=2)
+
     def _save_results(self, experiment: ExperimentResult, use_rich: bool = False) -> None:
         """Save experiment results to disk."""
         from rich.console import Console
@@ -870,8 +891,7 @@ class BenchmarkRunner:
 
         # Save summary
         summary = experiment.get_summary()
-        with open(results_dir / "summary.json", "w") as f:
-            json.dump(summary, f, indent=2)
+        self._dump_json(results_dir / "summary.json", summary)
 
         # Save detailed results
         all_results = {
@@ -883,8 +903,7 @@ class BenchmarkRunner:
             "treatment_results": [r.to_dict() for r in experiment.treatment_results],
         }
 
-        with open(results_dir / "results.json", "w") as f:
-            json.dump(all_results, f, indent=2)
+        self._dump_json(results_dir / "results.json", all_results)
 
         if use_rich:
             console = Console()
@@ -1020,6 +1039,14 @@ def main():
         help="Timeout for Docker evaluation in seconds (default: 1800)",
     )
 
+    parser.add_argument(
+        "--docker-workers",
+        type=int,
+        default=8,
+        metavar="N",
+        help="Parallel workers for swebench Docker evaluation (default: 8)",
+    )
+
     parser.add_argument(
         "--check-docker",
         action="store_true",
@@ -1058,6 +1085,7 @@ def main():
         use_repo_cache=not args.no_cache,
         use_docker=args.docker,
         docker_timeout=args.docker_timeout,
+        docker_max_workers=args.docker_workers,
     )
 
     # Handle cache commands
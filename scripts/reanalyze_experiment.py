@@ -14,7 +14,7 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from harness.conversation_parser import parse_workspace_conversation
+from harness.conversation_parser import parse_workspaces_bulk
 
 
 def reanalyze_experiment(results_dir: Path) -> dict:
@@ -47,21 +47,24 @@ def reanalyze_experiment(results_dir: Path) -> dict:
         print(f"\n=== {group.upper()} ===")
         results = data.get(group, [])
 
-        for result in results:
+        # Parse all conversation logs for the group in parallel, then
+        # report per task in order
+        workspaces = [
+            (
+                benchmark_root / "workspace" / result["group"] / result["task_id"],
+                result.get("start_time"),
+                result.get("end_time"),
+            )
+            for result in results
+        ]
+        all_metrics = parse_workspaces_bulk(workspaces)
+
+        for result, (workspace, _, _), conv_metrics in zip(results, workspaces, all_metrics):
             task_id = result["task_id"]
-            group_name = result["group"]
-
-            # Construct workspace path
-            workspace = benchmark_root / "workspace" / group_name / task_id
 
             print(f"\n{task_id}:")
             print(f"  Workspace: {workspace}")
 
-            # Parse conversation logs with time filtering
-            start_time = result.get("start_time")
-            end_time = result.get("end_time")
-            conv_metrics = parse_workspace_conversation(workspace, start_time, end_time)
-
             if conv_metrics is None:
                 print("  [No conversation found]")
                 continue